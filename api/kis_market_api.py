@@ -2,6 +2,7 @@
 KIS API 시세 조회 관련 함수 (공식 문서 기반)
 """
 import time
+import threading
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -34,6 +35,48 @@ def get_inquire_price(div_code: str = "J", itm_no: str = "", tr_cont: str = "",
         return None
 
 
+# 현재가 조회 결과 단기 캐시 {(시장구분, 종목코드): (monotonic 조회 시각, DataFrame)}
+# 장중 스캔 → 호가 분석 → 스캔 결과 저장 등 짧은 시간 내 같은 종목 중복 조회 병합용
+_price_cache: Dict[Tuple[str, str], Tuple[float, pd.DataFrame]] = {}
+_price_cache_lock = threading.Lock()
+_PRICE_CACHE_MAX_SIZE = 256
+
+
+def get_inquire_price_cached(div_code: str = "J", itm_no: str = "",
+                             max_age: float = 2.0) -> Optional[pd.DataFrame]:
+    """주식현재가 시세 (TTL 캐시)
+
+    max_age 초 이내에 조회한 결과가 있으면 API 호출 없이 재사용한다.
+    반환된 DataFrame 은 여러 호출자가 공유하므로 읽기 전용으로 사용해야 한다.
+
+    Args:
+        div_code: 시장 구분 (J:주식/ETF/ETN, W:ELW)
+        itm_no: 종목번호(6자리)
+        max_age: 캐시 허용 시간(초)
+    """
+    key = (div_code, itm_no)
+    now = time.monotonic()
+    with _price_cache_lock:
+        cached = _price_cache.get(key)
+    if cached is not None and now - cached[0] < max_age:
+        return cached[1]
+
+    price_data = get_inquire_price(div_code=div_code, itm_no=itm_no)
+    if price_data is None:
+        return None
+
+    with _price_cache_lock:
+        _price_cache[key] = (time.monotonic(), price_data)
+        if len(_price_cache) > _PRICE_CACHE_MAX_SIZE:
+            # 크기 초과 시 오래된 항목(10초 이상) 정리, 그래도 크면 전체 비움
+            expire_before = time.monotonic() - 10.0
+            for k in [k for k, (ts, _) in _price_cache.items() if ts < expire_before]:
+                del _price_cache[k]
+            if len(_price_cache) > _PRICE_CACHE_MAX_SIZE:
+                _price_cache.clear()
+    return price_data
+
+
 def get_inquire_ccnl(div_code: str = "J", itm_no: str = "", tr_cont: str = "",
                      FK100: str = "", NK100: str = "") -> Optional[pd.DataFrame]:
     """주식현재가 체결 (최근 30건)"""
@@ -316,35 +316,41 @@ class TradeDatabase:
     
     # === Intraday Scan 관련 메서드들 ===
     
+    _INTRADAY_SCAN_INSERT_SQL = """
+        INSERT INTO intraday_scans (
+            scan_date, scan_time, stock_code, stock_name,
+            selection_score, selection_criteria, scan_reason,
+            current_price, volume_spike_ratio, price_change_rate,
+            contract_strength, buy_ratio
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _intraday_scan_params(stock_data: Dict[str, Any], current_time: datetime) -> Tuple:
+        """intraday_scans INSERT 파라미터 튜플 생성"""
+        return (
+            current_time.date(),
+            current_time,
+            stock_data.get('stock_code'),
+            stock_data.get('stock_name'),
+            stock_data.get('selection_score'),
+            json.dumps(stock_data.get('selection_criteria', {}), ensure_ascii=False),
+            stock_data.get('scan_reason'),
+            stock_data.get('current_price'),
+            stock_data.get('volume_spike_ratio'),
+            stock_data.get('price_change_rate'),
+            stock_data.get('contract_strength'),
+            stock_data.get('buy_ratio')
+        )
+    
     def save_intraday_scan(self, stock_data: Dict[str, Any]) -> int:
         """장중 스캔 결과 저장"""
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                current_time = now_kst()
-                
-                cursor.execute("""
-                    INSERT INTO intraday_scans (
-                        scan_date, scan_time, stock_code, stock_name,
-                        selection_score, selection_criteria, scan_reason,
-                        current_price, volume_spike_ratio, price_change_rate,
-                        contract_strength, buy_ratio
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    current_time.date(),
-                    current_time,
-                    stock_data.get('stock_code'),
-                    stock_data.get('stock_name'),
-                    stock_data.get('selection_score'),
-                    json.dumps(stock_data.get('selection_criteria', {}), ensure_ascii=False),
-                    stock_data.get('scan_reason'),
-                    stock_data.get('current_price'),
-                    stock_data.get('volume_spike_ratio'),
-                    stock_data.get('price_change_rate'),
-                    stock_data.get('contract_strength'),
-                    stock_data.get('buy_ratio')
-                ))
+                cursor.execute(self._INTRADAY_SCAN_INSERT_SQL,
+                               self._intraday_scan_params(stock_data, now_kst()))
                 
                 record_id = cursor.lastrowid or 0
                 conn.commit()
@@ -356,6 +362,44 @@ class TradeDatabase:
             logger.error(f"장중 스캔 결과 저장 실패: {e}")
             return 0
     
+    @staticmethod
+    def _build_intraday_scan_data(stock_code: str, stock_name: Optional[str],
+                                  score: float, reasons: str) -> Dict[str, Any]:
+        """장중 스캔 결과 저장용 데이터 생성 (KIS API 현재가 정보 포함)"""
+        # KIS API를 통한 현재가 정보 조회
+        try:
+            from api.kis_market_api import get_inquire_price_cached
+            # 직전 장중 스캔(호가 분석)에서 조회한 현재가 재사용 – 기록용이므로 수 초 지연 허용
+            price_data = get_inquire_price_cached(div_code="J", itm_no=stock_code, max_age=10.0)
+        except ImportError:
+            logger.warning("KIS API 모듈을 찾을 수 없음 - 기본값으로 저장")
+            price_data = None
+        
+        # 기본 스캔 데이터 준비
+        scan_data = {
+            'stock_code': stock_code,
+            'stock_name': stock_name if stock_name else f"종목{stock_code}",
+            'selection_score': score,
+            'selection_criteria': reasons,
+            'scan_reason': 'intraday_scan',
+            'current_price': 0,
+            'volume_spike_ratio': 1.0,
+            'price_change_rate': 0.0,
+            'contract_strength': 100.0,
+            'buy_ratio': 50.0
+        }
+        
+        # KIS API 데이터가 있으면 추가 정보 수집
+        if price_data is not None and not price_data.empty:
+            row = price_data.iloc[0]
+            scan_data.update({
+                'current_price': float(row.get('stck_prpr', 0)),  # 현재가
+                'price_change_rate': float(row.get('prdy_ctrt', 0.0)),  # 전일대비율
+                'volume_spike_ratio': 1.0  # 추후 계산 로직 추가 가능
+            })
+        
+        return scan_data
+    
     def save_intraday_scan_result(self, stock_code: str, stock_name: Optional[str], 
                                   score: float, reasons: str) -> int:
         """장중 스캔 결과를 API 호출과 함께 저장
@@ -370,36 +414,7 @@ class TradeDatabase:
             저장된 레코드 ID (실패시 0)
         """
         try:
-            # KIS API를 통한 현재가 정보 조회
-            try:
-                from api.kis_market_api import get_inquire_price
-                price_data = get_inquire_price(div_code="J", itm_no=stock_code)
-            except ImportError:
-                logger.warning("KIS API 모듈을 찾을 수 없음 - 기본값으로 저장")
-                price_data = None
-            
-            # 기본 스캔 데이터 준비
-            scan_data = {
-                'stock_code': stock_code,
-                'stock_name': stock_name if stock_name else f"종목{stock_code}",
-                'selection_score': score,
-                'selection_criteria': reasons,
-                'scan_reason': 'intraday_scan',
-                'current_price': 0,
-                'volume_spike_ratio': 1.0,
-                'price_change_rate': 0.0,
-                'contract_strength': 100.0,
-                'buy_ratio': 50.0
-            }
-            
-            # KIS API 데이터가 있으면 추가 정보 수집
-            if price_data is not None and not price_data.empty:
-                row = price_data.iloc[0]
-                scan_data.update({
-                    'current_price': float(row.get('stck_prpr', 0)),  # 현재가
-                    'price_change_rate': float(row.get('prdy_ctrt', 0.0)),  # 전일대비율
-                    'volume_spike_ratio': 1.0  # 추후 계산 로직 추가 가능
-                })
+            scan_data = self._build_intraday_scan_data(stock_code, stock_name, score, reasons)
             
             # 데이터베이스에 저장
             result = self.save_intraday_scan(scan_data)
@@ -409,6 +424,36 @@ class TradeDatabase:
             logger.error(f"❌ 장중 스캔 결과 처리 및 저장 오류 {stock_code}: {e}")
             return 0
     
+    def save_intraday_scan_results_batch(self, rows: List[Tuple[str, Optional[str], float, str]]) -> int:
+        """장중 스캔 결과 일괄 저장 (단일 트랜잭션 executemany)
+        
+        Args:
+            rows: (종목코드, 종목명, 선정 점수, 선정 사유) 리스트
+            
+        Returns:
+            저장된 레코드 수 (실패시 0)
+        """
+        if not rows:
+            return 0
+        
+        try:
+            current_time = now_kst()
+            params = [
+                self._intraday_scan_params(self._build_intraday_scan_data(code, name, score, reasons), current_time)
+                for code, name, score, reasons in rows
+            ]
+            
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(self._INTRADAY_SCAN_INSERT_SQL, params)
+                conn.commit()
+            
+            logger.debug(f"장중 스캔 결과 일괄 저장: {len(params)}건")
+            return len(params)
+            
+        except Exception as e:
+            logger.error(f"❌ 장중 스캔 결과 일괄 저장 오류 ({len(rows)}건): {e}")
+            return 0
+    
     # === Buy Orders 관련 메서드들 ===
     
     def save_buy_order(self, order_data: Dict[str, Any]) -> int:
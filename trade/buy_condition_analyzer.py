@@ -11,7 +11,7 @@
 
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, time as dt_time
-from models.stock import Stock, StockStatus
+from models.stock import Stock, StockStatus, RealtimeData
 from utils.korean_time import now_kst
 from utils.logger import setup_logger
 
@@ -22,7 +22,7 @@ class BuyConditionAnalyzer:
     """매수 조건 분석 전담 클래스 (Static Methods)"""
     
     @staticmethod
-    def analyze_buy_conditions(stock: Stock, realtime_data: Dict, 
+    def analyze_buy_conditions(stock: Stock, realtime_data: RealtimeData, 
                               market_phase: str, strategy_config: Dict,
                               performance_config: Dict) -> bool:
         """데이트레이딩 특화 매수 조건 분석 (속도 최적화 + 모멘텀 중심)
@@ -130,33 +130,32 @@ class BuyConditionAnalyzer:
             return False
     
     @staticmethod
-    def _check_basic_eligibility(stock: Stock, realtime_data: Dict, strategy_config: Dict, performance_config: Dict) -> bool:
+    def _check_basic_eligibility(stock: Stock, realtime_data: RealtimeData, strategy_config: Dict, performance_config: Dict) -> bool:
         """기본 적격성 체크 (즉시 배제 조건)"""
         try:
-            # 거래정지, VI발동 등 절대 금지 조건
-            vi_standard_price = getattr(stock.realtime_data, 'vi_standard_price', 0)
-            trading_halt = getattr(stock.realtime_data, 'trading_halt', False)
+            # 실시간 필드는 진입 시 1회만 로컬 변수로 풀어 사용 (반복 getattr 제거)
+            rt = stock.realtime_data
             
-            hour_cls_code = getattr(stock.realtime_data, 'hour_cls_code', '0')
-            market_op_code = getattr(stock.realtime_data, 'market_operation_code', '20')
-            is_vi = (hour_cls_code in ['51', '52']) or (market_op_code in ['30', '31'])
+            # 거래정지, VI발동 등 절대 금지 조건
+            trading_halt = rt.trading_halt
+            is_vi = (rt.hour_cls_code in ('51', '52')) or (rt.market_operation_code in ('30', '31'))
             
             if trading_halt or is_vi:
                 logger.debug(f"거래 제외: {stock.stock_code} (거래정지: {trading_halt}, VI발동: {is_vi})")
                 return False
             
             # 가격 정보 확인
-            current_price = realtime_data.get('current_price', stock.close_price)
+            current_price = realtime_data.current_price
             if current_price <= 0:
                 logger.debug(f"가격 정보 없음: {stock.stock_code}")
                 return False
             
             # 🔥 실시간 데이터 품질 체크 (시스템 완전성 가정)
-            total_ask_qty = getattr(stock.realtime_data, 'total_ask_qty', 0)
-            total_bid_qty = getattr(stock.realtime_data, 'total_bid_qty', 0)
-            volume_turnover_rate = getattr(stock.realtime_data, 'volume_turnover_rate', 0.0)
-            buy_contract_count = getattr(stock.realtime_data, 'buy_contract_count', 0)
-            sell_contract_count = getattr(stock.realtime_data, 'sell_contract_count', 0)
+            total_ask_qty = rt.total_ask_qty
+            total_bid_qty = rt.total_bid_qty
+            volume_turnover_rate = rt.volume_turnover_rate
+            buy_contract_count = rt.buy_contract_count
+            sell_contract_count = rt.sell_contract_count
             
             # 필수 실시간 데이터 존재 여부 확인
             has_orderbook_data = (total_ask_qty > 0 and total_bid_qty > 0)
@@ -164,7 +163,7 @@ class BuyConditionAnalyzer:
             has_contract_data = (buy_contract_count > 0 or sell_contract_count > 0)
             
             # 최소 1가지 이상의 실시간 데이터가 있어야 매수 허용 (완화)
-            realtime_data_score = sum([has_orderbook_data, has_volume_data, has_contract_data])
+            realtime_data_score = has_orderbook_data + has_volume_data + has_contract_data
             min_required_data = strategy_config.get('min_realtime_data_types', 1)  # 2 → 1 완화
             
             if realtime_data_score < min_required_data:
@@ -174,9 +173,10 @@ class BuyConditionAnalyzer:
                 return False
             
             # price_change_rate 백업 로직
-            price_change_rate = realtime_data.get('price_change_rate', 0)
-            if price_change_rate == 0 and stock.reference_data.yesterday_close > 0:
-                calculated_rate = (current_price - stock.reference_data.yesterday_close) / stock.reference_data.yesterday_close * 100
+            price_change_rate = realtime_data.price_change_rate
+            yesterday_close = stock.reference_data.yesterday_close
+            if price_change_rate == 0 and yesterday_close > 0:
+                calculated_rate = (current_price - yesterday_close) / yesterday_close * 100
                 price_change_rate = calculated_rate
                 logger.debug(f"price_change_rate 계산: {stock.stock_code} = {calculated_rate:.2f}%")
             
@@ -193,8 +193,8 @@ class BuyConditionAnalyzer:
             
             # 유동성 부족 체크 (호가 스프레드) - 실시간 데이터가 있을 때만
             if has_orderbook_data:
-                bid_price = realtime_data.get('bid_price', 0)
-                ask_price = realtime_data.get('ask_price', 0)
+                bid_price = realtime_data.bid_price
+                ask_price = realtime_data.ask_price
                 if bid_price > 0 and ask_price > 0:
                     spread_rate = (ask_price - bid_price) / bid_price * 100
                     max_spread = strategy_config.get('max_spread_threshold', 8.0)  # 5.0% → 8.0% 완화
@@ -203,7 +203,7 @@ class BuyConditionAnalyzer:
                         return False
             
             # 체결강도 최솟값 필터
-            contract_strength = getattr(stock.realtime_data, 'contract_strength', 100.0)
+            contract_strength = rt.contract_strength
             min_cs = strategy_config.get('min_contract_strength_for_buy',
                                          performance_config.get('min_contract_strength_for_buy', 100.0))  # 120.0 → 100.0 완화
             if contract_strength < min_cs:
@@ -224,7 +224,7 @@ class BuyConditionAnalyzer:
                 return False
             
             # 🆕 일중 변동성 조건 (저변동성 종목 제외)
-            volatility = getattr(stock.realtime_data, 'volatility', 0.0)
+            volatility = rt.volatility
             min_daily_volatility = strategy_config.get('min_daily_volatility', 1.0)
             if volatility < min_daily_volatility:
                 logger.debug(f"일중 변동성 부족 제외: {stock.stock_code} ({volatility:.1f}% < {min_daily_volatility}%)")
@@ -237,20 +237,21 @@ class BuyConditionAnalyzer:
             return False
     
     @staticmethod
-    def _calculate_momentum_score(stock: Stock, realtime_data: Dict, market_phase: str, 
+    def _calculate_momentum_score(stock: Stock, realtime_data: RealtimeData, market_phase: str, 
                                  performance_config: Dict) -> int:
         """🚀 모멘텀 점수 계산 (0~40점)"""
         try:
             momentum_score = 0
             
             # 가격 변화율 계산
-            current_price = realtime_data.get('current_price', stock.close_price)
-            price_change_rate = realtime_data.get('price_change_rate', 0)
-            if price_change_rate == 0 and stock.reference_data.yesterday_close > 0:
-                price_change_rate = (current_price - stock.reference_data.yesterday_close) / stock.reference_data.yesterday_close * 100
-            
-            volume_spike_ratio = realtime_data.get('volume_spike_ratio', 1.0)
-            contract_strength = getattr(stock.realtime_data, 'contract_strength', 100.0)
+            current_price = realtime_data.current_price
+            price_change_rate = realtime_data.price_change_rate
+            yesterday_close = stock.reference_data.yesterday_close
+            if price_change_rate == 0 and yesterday_close > 0:
+                price_change_rate = (current_price - yesterday_close) / yesterday_close * 100
+            
+            volume_spike_ratio = realtime_data.volume_spike_ratio
+            contract_strength = stock.realtime_data.contract_strength
             
             # 1. 가격 상승 모멘텀 (0~15점)
             if price_change_rate >= 3.0:  # 3% 이상
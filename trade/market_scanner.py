@@ -2,6 +2,7 @@
 장시작전 시장 스캔 및 종목 선정을 담당하는 MarketScanner 클래스
 """
 
+import numpy as np
 from typing import Dict, List, Tuple, Optional, Any, TYPE_CHECKING
 from datetime import datetime, timedelta
 from models.stock import Stock
@@ -24,6 +25,14 @@ except ImportError:
 
 logger = setup_logger(__name__)
 
+# 현재가 조회 응답에서 사용하는 필드 (순서 = 언패킹 순서)
+_PRICE_ROW_FIELDS = ('stck_prpr', 'acml_vol', 'stck_oprc', 'stck_hgpr', 'stck_lwpr', 'hts_avls')
+
+
+def _nan_to(value: float, default: float) -> float:
+    """reindex 로 누락(NaN) 처리된 필드만 기본값으로 대체 (실제 0 값은 유지)"""
+    return default if np.isnan(value) else float(value)
+
 # 공통 유틸 함수 (scanner.utils)
 from trade.scanner.utils import (
     is_data_empty as _is_data_empty,
@@ -411,10 +420,17 @@ class MarketScanner:
                 return None
             
             try:
-                # 현재가 정보 (price_data에서)
-                row = price_data.iloc[0]
-                current_price = float(row.get('stck_prpr', 0))
-                volume = int(row.get('acml_vol', 0))
+                # 현재가 정보 (price_data에서) - 필요한 필드를 한 번에 추출 (누락 필드는 NaN)
+                current_price, volume, open_price, high_price, low_price, market_cap = (
+                    price_data.iloc[0].reindex(_PRICE_ROW_FIELDS).to_numpy(dtype=np.float64)
+                )
+                current_price = _nan_to(current_price, 0.0)
+                volume = int(_nan_to(volume, 0))
+                # 누락된 시가/고가/저가만 현재가로 대체
+                open_price = _nan_to(open_price, current_price)
+                high_price = _nan_to(high_price, current_price)
+                low_price = _nan_to(low_price, current_price)
+                market_cap = _nan_to(market_cap, 0)
                 
                 # 🔥 일봉 데이터에서 정확한 전일종가 추출
                 yesterday_close = current_price  # 기본값
@@ -466,8 +482,6 @@ class MarketScanner:
                     return None
                 
                 # 🆕 일중 변동성 조건 (고가/저가 기반)
-                high_price = float(row.get('stck_hgpr', current_price))
-                low_price = float(row.get('stck_lwpr', current_price))
                 if high_price > 0 and low_price > 0 and low_price != high_price:
                     daily_volatility = (high_price - low_price) / low_price * 100
                     if daily_volatility < self.min_daily_volatility:
@@ -480,14 +494,14 @@ class MarketScanner:
                     'stock_name': stock_name,
                     'current_price': current_price,
                     'yesterday_close': yesterday_close,  # 일봉 데이터에서 추출
-                    'open_price': float(row.get('stck_oprc', current_price)),
-                    'high_price': float(row.get('stck_hgpr', current_price)),
-                    'low_price': float(row.get('stck_lwpr', current_price)),
+                    'open_price': open_price,
+                    'high_price': high_price,
+                    'low_price': low_price,
                     'volume': volume,
                     'yesterday_volume': yesterday_volume,  # 일봉 데이터에서 추출
                     'price_change': current_price - yesterday_close,  # 정확한 가격 변화량
                     'price_change_rate': accurate_price_change_rate,  # 정확한 변화율
-                    'market_cap': int(row.get('hts_avls', 0)) if 'hts_avls' in row else 0
+                    'market_cap': int(market_cap)
                 }
                 
                 logger.debug(f"✅ 종목 기본정보 조회 성공: {stock_code}[{stock_name}] "
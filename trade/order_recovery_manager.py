@@ -9,6 +9,7 @@
 - 강제 주문 취소
 """
 
+import threading
 from typing import List, Dict, Optional, TYPE_CHECKING
 from datetime import datetime
 from models.stock import Stock, StockStatus
@@ -44,6 +45,11 @@ class OrderRecoveryManager:
         self.successful_api_cancels = 0
         self.failed_api_cancels = 0
         
+        # 🆕 통계 스냅샷 (상태 변화 시점에만 갱신, 조회는 복사본 반환)
+        self._stats_lock = threading.Lock()
+        self._stats_snapshot: Dict = {}
+        self._refresh_stats_snapshot()
+        
         logger.info("OrderRecoveryManager 초기화 완료")
     
     def auto_recover_stuck_orders(self) -> int:
@@ -69,7 +75,9 @@ class OrderRecoveryManager:
                 recovered += 1
         
         # 3단계: 통계 업데이트
-        self.total_recoveries += recovered
+        if recovered > 0:
+            self.total_recoveries += recovered
+            self._refresh_stats_snapshot()
         
         if recovered > 0:
             logger.info(f"🔧 총 {recovered}개 정체 주문 복구 완료 (KIS API 취소 포함)")
@@ -187,15 +195,18 @@ class OrderRecoveryManager:
             if cancel_success:
                 logger.info(f"✅ KIS API 주문 취소 성공: {stock.stock_code} {order_type}")
                 self.successful_api_cancels += 1
+                self._refresh_stats_snapshot()
                 return True
             else:
                 logger.warning(f"⚠️ KIS API 주문 취소 실패: {stock.stock_code} {order_type}")
                 self.failed_api_cancels += 1
+                self._refresh_stats_snapshot()
                 return False
                 
         except Exception as e:
             logger.error(f"❌ KIS API 주문 취소 오류 {stock.stock_code}: {e}")
             self.failed_api_cancels += 1
+            self._refresh_stats_snapshot()
             return False
     
     def _recover_order_state(self, stock_code: str, order_type: str, api_cancel_success: bool) -> bool:
@@ -320,22 +331,30 @@ class OrderRecoveryManager:
             logger.error(f"강제 주문 취소 오류: {e}")
             return cancelled
     
-    def get_recovery_statistics(self) -> Dict:
-        """복구 통계 정보 반환
-        
-        Returns:
-            복구 통계 딕셔너리
-        """
-        return {
+    def _refresh_stats_snapshot(self):
+        """통계 스냅샷 재계산 (카운터/설정 변경 시점에 호출)"""
+        api_cancel_total = self.successful_api_cancels + self.failed_api_cancels
+        snapshot = {
             'total_recoveries': self.total_recoveries,
             'successful_api_cancels': self.successful_api_cancels,
             'failed_api_cancels': self.failed_api_cancels,
             'api_cancel_success_rate': (
-                self.successful_api_cancels / (self.successful_api_cancels + self.failed_api_cancels) * 100
-                if (self.successful_api_cancels + self.failed_api_cancels) > 0 else 0
+                self.successful_api_cancels / api_cancel_total * 100
+                if api_cancel_total > 0 else 0
             ),
             'stuck_order_timeout_minutes': self.stuck_order_timeout_minutes
         }
+        with self._stats_lock:
+            self._stats_snapshot = snapshot
+    
+    def get_recovery_statistics(self) -> Dict:
+        """복구 통계 정보 반환 (사전 계산된 스냅샷 복사본)
+        
+        Returns:
+            복구 통계 딕셔너리
+        """
+        with self._stats_lock:
+            return self._stats_snapshot.copy()
     
     def set_stuck_order_timeout(self, minutes: int):
         """정체된 주문 타임아웃 설정
@@ -345,6 +364,7 @@ class OrderRecoveryManager:
         """
         if minutes > 0:
             self.stuck_order_timeout_minutes = minutes
+            self._refresh_stats_snapshot()
             logger.info(f"정체된 주문 타임아웃 설정: {minutes}분")
         else:
             logger.warning("타임아웃은 0보다 커야 합니다")
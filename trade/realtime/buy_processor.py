@@ -3,7 +3,7 @@
 RealTimeMonitor 에서 분리된 BuyProcessor 클래스. 
 단일 책임 원칙에 따라 매수 판단 로직과 주문 실행을 담당한다.
 
-• analyze_and_buy(stock, realtime_data): 조건 분석→수량 계산→주문 실행
+• analyze_and_buy(stock): 조건 분석→수량 계산→주문 실행 (stock.realtime_data 직접 사용)
 • analyze_buy_conditions(): TradingConditionAnalyzer 위임 래퍼
 • calculate_buy_quantity(): TradingConditionAnalyzer 위임 래퍼
 
@@ -14,12 +14,15 @@ stock_manager, trade_executor, condition_analyzer, config 들을 전달받아
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Optional, TYPE_CHECKING, Any
-from datetime import datetime
+from datetime import datetime, time as dt_time
 
 from models.stock import Stock, StockStatus
 from utils.korean_time import now_kst
-from utils.logger import setup_logger
+from utils.logger import setup_logger, is_debug_enabled
 
 if TYPE_CHECKING:
     from trade.stock_manager import StockManager
@@ -28,6 +31,9 @@ if TYPE_CHECKING:
 
 logger = setup_logger(__name__)
 
+# 최근 매수 시각 기록 최대 보관 수 (쿨다운 경과 항목은 그 전에 정리됨)
+_RECENT_BUY_MAX = 1024
+
 
 class BuyProcessor:
     """매수 조건 분석 + 주문 실행 전담 클래스"""
@@ -53,8 +59,16 @@ class BuyProcessor:
         self.risk_config: Dict[str, Any] = risk_config
         self.duplicate_buy_cooldown: int = max(1, duplicate_buy_cooldown)
 
-        # 내부 상태
-        self._recent_buy_times: Dict[str, datetime] = {}
+        # 🆕 종목마다 조회하던 선행 체크 설정값 사전 계산
+        self._pre_close_time: dt_time = dt_time(
+            performance_config.get("pre_close_hour", 14),
+            performance_config.get("pre_close_minute", 50),
+        )
+        self._max_open_positions: int = risk_config.get("max_open_positions", 10)
+
+        # 내부 상태 – 최근 매수 monotonic 시각 (삽입 순서 = 시각 순서, _record_buy_time 에서 크기 제한)
+        self._recent_buy_times: "OrderedDict[str, float]" = OrderedDict()
+        self._recent_buy_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # 공개 메서드
@@ -62,32 +76,31 @@ class BuyProcessor:
     def analyze_buy_conditions(
         self,
         stock: Stock,
-        realtime_data: Dict[str, Any],
         market_phase: Optional[str] = None,
     ) -> bool:
-        """TradingConditionAnalyzer 래퍼"""
+        """TradingConditionAnalyzer 래퍼 (Stock 의 실시간 데이터를 그대로 전달)"""
         return self.condition_analyzer.analyze_buy_conditions(
-            stock, realtime_data, market_phase
+            stock, stock.realtime_data, market_phase
         )
 
-    def calculate_buy_quantity(self, stock: Stock) -> int:
+    def calculate_buy_quantity(self, stock: Stock, market_phase: Optional[str] = None) -> int:
         """TradingConditionAnalyzer 래퍼"""
-        return self.condition_analyzer.calculate_buy_quantity(stock)
+        return self.condition_analyzer.calculate_buy_quantity(stock, market_phase)
 
     def analyze_and_buy(
         self,
         stock: Stock,
-        realtime_data: Dict[str, Any],
         current_positions_count: int,
         market_phase: Optional[str] = None,
+        now: Optional[datetime] = None,
     ) -> bool:
         """매수 조건 분석 → 주문 실행 전체 프로세스.
 
         Args:
             stock: 매수 후보 Stock 객체
-            realtime_data: 실시간 데이터 dict (current_price 등)
             current_positions_count: 현재 보유 포지션 수 (한도 체크용)
             market_phase: 이미 계산된 시장 단계(옵션)
+            now: 사이클 기준 시각 (옵션, None 이면 now_kst())
 
         Returns:
             bool: 주문 접수 성공 여부
@@ -96,30 +109,32 @@ class BuyProcessor:
             # -----------------------------------------------------------
             # 선행 체크 (쿨다운, 마감 임박, 포지션 한도)
             # -----------------------------------------------------------
-            if not self._pre_checks(stock, realtime_data, current_positions_count):
+            if not self._pre_checks(stock, current_positions_count, now):
                 return False
 
             # -----------------------------------------------------------
             # 조건 분석
             # -----------------------------------------------------------
-            buy_signal = self.analyze_buy_conditions(stock, realtime_data, market_phase)
+            buy_signal = self.analyze_buy_conditions(stock, market_phase)
             if not buy_signal:
                 return False
 
             # -----------------------------------------------------------
             # 수량 계산
             # -----------------------------------------------------------
-            quantity = self.calculate_buy_quantity(stock)
+            quantity = self.calculate_buy_quantity(stock, market_phase)
             if quantity <= 0:
-                logger.debug(f"{stock.stock_code} 매수수량 0 – 주문 건너뜀")
+                if is_debug_enabled():
+                    logger.debug(f"{stock.stock_code} 매수수량 0 – 주문 건너뜀")
                 return False
 
             # -----------------------------------------------------------
             # 주문 실행
             # -----------------------------------------------------------
-            price = realtime_data.get("current_price") or 0
+            price = stock.realtime_data.current_price or 0
             if price <= 0:
-                logger.debug(f"{stock.stock_code} 현재가 없음 – 주문 건너뜀")
+                if is_debug_enabled():
+                    logger.debug(f"{stock.stock_code} 현재가 없음 – 주문 건너뜀")
                 return False
 
             success = self.trade_executor.execute_buy_order(
@@ -131,7 +146,7 @@ class BuyProcessor:
 
             if success:
                 # 최근 매수 시각 기록 (중복 방지)
-                self._recent_buy_times[stock.stock_code] = now_kst()
+                self._record_buy_time(stock.stock_code)
                 logger.info(
                     f"✅ 매수 주문 성공: {stock.stock_code} {quantity}주 @{price:,}원"
                 )
@@ -148,14 +163,32 @@ class BuyProcessor:
     # ------------------------------------------------------------------
     # 내부 메서드
     # ------------------------------------------------------------------
+    def _record_buy_time(self, stock_code: str) -> None:
+        """최근 매수 시각(monotonic) 기록 – 삽입 시 오래된 항목을 앞에서부터 정리
+
+        쿨다운의 10배 이상 지난 항목과 _RECENT_BUY_MAX 초과분을 제거하므로
+        세션 동안 매수한 종목 수와 무관하게 크기가 제한된다.
+        """
+        recent = self._recent_buy_times
+        bought_at = time.monotonic()
+        expire_before = bought_at - self.duplicate_buy_cooldown * 10
+        with self._recent_buy_lock:
+            recent[stock_code] = bought_at
+            recent.move_to_end(stock_code)
+            # 방금 넣은 항목은 가장 최신이므로 루프는 비기 전에 종료
+            while len(recent) > _RECENT_BUY_MAX or next(iter(recent.values())) < expire_before:
+                recent.popitem(last=False)
+
     def _pre_checks(
         self,
         stock: Stock,
-        realtime_data: Dict[str, Any],
         current_positions_count: int,
+        now: Optional[datetime] = None,
     ) -> bool:
-        """매수 전 공통 선행 체크"""
+        """매수 전 공통 선행 체크 (마감 체크는 사이클 기준 시각, 쿨다운은 monotonic 시각 사용)"""
         try:
+            now_dt: datetime = now if now is not None else now_kst()
+
             # 1) 이미 보유 중이거나 매수 주문이 진행중인 종목은 패스
             if stock.status in (
                 StockStatus.BOUGHT,          # 이미 매수 완료
@@ -164,32 +197,24 @@ class BuyProcessor:
             ):
                 return False
 
-            # 2) 중복 매수 쿨다운
+            # 2) 중복 매수 쿨다운 (monotonic 실수 뺄셈 1회 – timedelta 생성 없음)
             last_buy_time = self._recent_buy_times.get(stock.stock_code)
-            if last_buy_time and (now_kst() - last_buy_time).total_seconds() < self.duplicate_buy_cooldown:
-                logger.debug(
-                    f"쿨다운 미지남 - 중복 매수 스킵: {stock.stock_code}"
-                )
+            if last_buy_time is not None and time.monotonic() - last_buy_time < self.duplicate_buy_cooldown:
+                if is_debug_enabled():
+                    logger.debug(f"쿨다운 미지남 - 중복 매수 스킵: {stock.stock_code}")
                 return False
 
-            # 3) 장 마감 임박 시간 체크 (performance_config 에서 임계값 가져오기)
-            from datetime import datetime, time as dt_time
-
-            now_dt: datetime = now_kst()
-            pre_close_hour = self.performance_config.get("pre_close_hour", 14)
-            pre_close_minute = self.performance_config.get("pre_close_minute", 50)
-            market_close_time = dt_time(pre_close_hour, pre_close_minute)
-            if now_dt.time() >= market_close_time:
+            # 3) 장 마감 임박 시간 체크 (performance_config 임계값은 초기화 시 계산)
+            if now_dt.time() >= self._pre_close_time:
                 return False
 
             # 4) 포지션 최대 보유 수
-            max_positions = self.risk_config.get("max_open_positions", 10)
-            if current_positions_count >= max_positions:
+            if current_positions_count >= self._max_open_positions:
                 logger.debug("포지션 한도 초과 – 신규 매수 제한")
                 return False
 
             # 5) 호가/현재가 필수 값 존재
-            if realtime_data.get("current_price", 0) <= 0:
+            if stock.realtime_data.current_price <= 0:
                 return False
 
             return True
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from typing import Dict, TYPE_CHECKING
+import time
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from utils.korean_time import now_kst
+from models.stock import StockStatus
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 if TYPE_CHECKING:
     from trade.realtime_monitor import RealTimeMonitor
+    from datetime import datetime
     from models.stock import Stock
 
 
@@ -21,66 +23,106 @@ class BuyRunner:
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
-    def run(self) -> Dict[str, int]:
-        """매수 준비 상태 종목 처리 후 결과 dict 반환."""
+    def entries_open(self) -> bool:
+        """신규 매수 진입 가능 여부 (사이클 기준 시각이 pre_close / 데이트레이딩 종료 전)"""
+        now_time = self.m.cycle_now().time()
+        return now_time < self.m.pre_close_time and now_time < self.m.day_trading_exit_time
+
+    def run(self, positions_by_status: Optional[Dict[StockStatus, List["Stock"]]] = None) -> Dict[str, int]:
+        """매수 준비 상태 종목 처리 후 결과 dict 반환.
+
+        Args:
+            positions_by_status: 사이클 시작 시 일괄 조회한 상태별 종목 (없거나 WATCHING 이 빠져 있으면 직접 조회)
+        """
         result: Dict[str, int] = {"checked": 0, "signaled": 0, "ordered": 0}
 
         try:
             # 장 마감 임박 시 신규 진입 금지
-            now_time = now_kst().time()
-            if now_time >= self.m.pre_close_time or now_time >= self.m.day_trading_exit_time:
+            if not self.entries_open():
                 logger.debug("pre_close_time/day_trading_exit_time 이후 - 신규 매수 스킵")
                 return result
+            cycle_now = self.m.cycle_now()
 
-            # WATCHING / BOUGHT 배치 조회
-            from models.stock import StockStatus  # 로컬 import 순환 회피
-            batch = self.m.stock_manager.get_stocks_by_status_batch(
-                [StockStatus.WATCHING, StockStatus.BOUGHT]
-            )
-            ready_stocks = batch[StockStatus.WATCHING]
-            current_positions = len(batch[StockStatus.BOUGHT])
+            # WATCHING 종목만 Stock 조회, BOUGHT 는 개수만 확인 (사이클 스냅샷이 있으면 재사용)
+            sm = self.m.stock_manager
+            if positions_by_status is not None and StockStatus.WATCHING in positions_by_status:
+                ready_stocks = positions_by_status[StockStatus.WATCHING]
+            else:
+                ready_stocks = sm.get_stocks_by_status(StockStatus.WATCHING)
 
             if not ready_stocks:
                 return result
 
-            # 실시간 데이터 미리 수집
-            rt_dict = {}
-            for stk in ready_stocks:
-                try:
-                    rt = self.m.get_realtime_data(stk.stock_code)
-                    if rt:
-                        rt_dict[stk.stock_code] = rt
-                except Exception as exc:  # pylint: disable=broad-except
-                    logger.debug(f"실시간 데이터 조회 실패 {stk.stock_code}: {exc}")
-
-            for stk in ready_stocks:
-                result["checked"] += 1
-                rt = rt_dict.get(stk.stock_code)
-                if not rt:
-                    continue
-
-                try:
-                    # 1) 신호 판단 (BuyProcessor 사용)
-                    buy_signal = self.m.buy_processor.analyze_buy_conditions(
-                        stk, rt, self.m.get_market_phase()
-                    )
-                    if not buy_signal:
-                        continue
-                    result["signaled"] += 1
-
-                    # 2) 주문 실행 (BuyProcessor 사용)
-                    success = self.m.buy_processor.analyze_and_buy(
-                        stock=stk,
-                        realtime_data=rt,
-                        current_positions_count=current_positions,
-                        market_phase=self.m.get_market_phase(),
-                    )
-
-                    if success:
-                        result["ordered"] += 1
-                        self.m.stats_tracker.inc_buy_order()
-                except Exception as exc:  # pylint: disable=broad-except
-                    logger.error(f"매수 처리 오류 {stk.stock_code}: {exc}")
+            if positions_by_status is not None and StockStatus.BOUGHT in positions_by_status:
+                current_positions = len(positions_by_status[StockStatus.BOUGHT])
+            else:
+                current_positions = sm.count_by_status(StockStatus.BOUGHT)
+
+            # 시장 단계는 사이클당 1회만 조회
+            market_phase = self.m.get_market_phase()
+
+            # 알림 만료 판단 기준 시각도 사이클당 1회만 조회
+            alert_now = time.monotonic()
+
+            # 현재가 없는 종목·알림 유효 종목은 워커에 넘기기 전에 한 번에 제외
+            result["checked"] = len(ready_stocks)
+            candidates = [
+                stk for stk in ready_stocks
+                if stk.realtime_data.current_price > 0 and not self.m.is_alert_active(stk.stock_code, alert_now)
+            ]
+            if not candidates:
+                return result
+
+            # 종목별 분석·주문은 서로 독립 → 사이클 워커 풀에서 병렬 처리 후 집계
+            outcomes = self.m.map_stocks(
+                lambda stk: self._process_one(stk, market_phase, current_positions, cycle_now),
+                candidates,
+            )
+            for signaled, ordered in outcomes:
+                result["signaled"] += signaled
+                result["ordered"] += ordered
         except Exception as exc:  # pylint: disable=broad-except
             logger.error(f"매수 준비 종목 처리 오류: {exc}")
-        return result 
\ No newline at end of file
+        return result
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+    def _process_one(
+        self,
+        stk: "Stock",
+        market_phase: str,
+        current_positions: int,
+        cycle_now: "datetime",
+    ) -> Tuple[bool, bool]:
+        """단일 종목 매수 신호 판단 → 주문 (워커 스레드에서 실행될 수 있음)
+
+        입력은 run() 에서 현재가 유효·알림 미유효 종목으로 사전 검증된 상태.
+        예외는 종목 단위로 격리 (한 종목 오류가 풀 결과 집계 전체를 중단시키지 않도록).
+
+        Returns:
+            (신호 발생 여부, 주문 성공 여부)
+        """
+        try:
+            # 1) 신호 판단 (BuyProcessor 사용)
+            buy_signal = self.m.buy_processor.analyze_buy_conditions(
+                stk, market_phase
+            )
+            if not buy_signal:
+                return False, False
+
+            # 2) 주문 실행 (BuyProcessor 사용)
+            success = self.m.buy_processor.analyze_and_buy(
+                stock=stk,
+                current_positions_count=current_positions,
+                market_phase=market_phase,
+                now=cycle_now,
+            )
+
+            if success:
+                self.m.stats_tracker.inc_buy_order()
+                self.m.mark_alert(stk.stock_code)
+            return True, bool(success)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error(f"매수 처리 오류 {stk.stock_code}: {exc}")
+            return False, False 
\ No newline at end of file
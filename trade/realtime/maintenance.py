@@ -36,26 +36,17 @@ class MaintenanceManager:
             logger.error(f"정체 주문 검사 오류: {exc}")
 
     def cleanup(self) -> None:
-        """알림·구독 대기열·스레드 등 메모리 정리를 수행한다."""
+        """알림·구독 재시도 기록 등 메모리 정리를 수행한다."""
         try:
             cleanup_count = 0
 
-            # 1. alert_sent
-            if self.monitor.alert_sent:
-                self.monitor.alert_sent.clear()
+            # 1. alert_sent – 만료된 항목만 제거
+            if self.monitor.purge_expired_alerts():
                 cleanup_count += 1
 
             # 2. SubscriptionManager cleanup
             cleanup_count += self.monitor.sub_manager.cleanup()
 
-            # 3. ScanWorker thread 상태
-            if (
-                self.monitor.scan_worker._scan_thread  # pylint: disable=protected-access
-                and not self.monitor.scan_worker._scan_thread.is_alive()
-            ):
-                self.monitor.scan_worker._scan_thread = None
-                cleanup_count += 1
-
             if cleanup_count:
                 logger.info(f"🧹 메모리 정리 완료: {cleanup_count}개 항목 정리")
         except Exception as exc:
@@ -1,9 +1,15 @@
-from datetime import time as dt_time
-from typing import Dict, Any
+import time
+from datetime import datetime, time as dt_time
+from typing import Dict, Any, Optional, Tuple
 
 from utils.korean_time import now_kst
 
 
+def _seconds_of_day(t: dt_time) -> int:
+    """dt_time → 자정 기준 경과 초 (정수 비교용)."""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
 class MarketClock:
     """시장 개장/거래 가능 여부를 판단하는 유틸리티 클래스입니다.
 
@@ -24,26 +30,69 @@ class MarketClock:
             strategy_config.get("day_trading_exit_minute", 0),
         )
 
+        # dt_time 필드 비교 대신 정수 1회 비교로 판단하기 위한 사전 계산 값
+        self._market_open_sec = _seconds_of_day(self.market_open_time)
+        self._market_close_sec = _seconds_of_day(self.market_close_time)
+        self._day_trading_exit_sec = _seconds_of_day(self.day_trading_exit_time)
+
+        # 판단 결과 캐시 (monotonic 시각, 결과) – now 미지정 호출 전용, 결과는 분 단위로만 바뀌므로 1초 TTL
+        self._cache_ttl = 1.0
+        self._market_open_cache: Tuple[float, bool] = (float("-inf"), False)
+        self._trading_time_cache: Tuple[float, bool] = (float("-inf"), False)
+
     # -------------------------------------------------
     # 공개 API
     # -------------------------------------------------
-    def is_market_open(self) -> bool:
-        """코스피/코스닥 정규장 개장 여부."""
-        current_dt = now_kst()
-        current_time = current_dt.time()
+    def is_market_open(self, now: Optional[datetime] = None) -> bool:
+        """코스피/코스닥 정규장 개장 여부.
 
-        # 주말(토, 일) 휴장
-        if current_dt.weekday() >= 5:
-            return False
+        Args:
+            now: 기준 시각 (지정 시 캐시를 거치지 않고 해당 시각으로 판단,
+                 None 이면 1초 TTL 캐시 사용 후 만료 시에만 now_kst() 조회)
+        """
+        if now is not None:
+            return self._market_open_at(now)
 
-        return self.market_open_time <= current_time <= self.market_close_time
+        mono = time.monotonic()
+        cached_at, cached = self._market_open_cache
+        if mono - cached_at < self._cache_ttl:
+            return cached
 
-    def is_trading_time(self) -> bool:
-        """데이 트레이딩 가능 여부 (시장 개장 & 데이트레이딩 종료 전)."""
-        if not self.is_market_open():
-            return False
+        result = self._market_open_at(now_kst())
+        self._market_open_cache = (mono, result)
+        return result
+
+    def is_trading_time(self, now: Optional[datetime] = None) -> bool:
+        """데이 트레이딩 가능 여부 (시장 개장 & 데이트레이딩 종료 전).
 
-        if now_kst().time() >= self.day_trading_exit_time:
+        Args:
+            now: 기준 시각 (지정 시 캐시를 거치지 않고 해당 시각으로 판단,
+                 None 이면 1초 TTL 캐시 사용 후 만료 시에만 now_kst() 조회)
+        """
+        if now is not None:
+            return self._trading_time_at(now)
+
+        mono = time.monotonic()
+        cached_at, cached = self._trading_time_cache
+        if mono - cached_at < self._cache_ttl:
+            return cached
+
+        result = self._trading_time_at(now_kst())
+        self._trading_time_cache = (mono, result)
+        return result
+
+    # -------------------------------------------------
+    # 내부 헬퍼
+    # -------------------------------------------------
+    def _market_open_at(self, current_dt: datetime) -> bool:
+        # 주말(토, 일) 휴장
+        if current_dt.weekday() >= 5:
             return False
+        sec = current_dt.hour * 3600 + current_dt.minute * 60 + current_dt.second
+        return self._market_open_sec <= sec <= self._market_close_sec
 
-        return True 
\ No newline at end of file
+    def _trading_time_at(self, current_dt: datetime) -> bool:
+        if current_dt.weekday() >= 5:
+            return False
+        sec = current_dt.hour * 3600 + current_dt.minute * 60 + current_dt.second
+        return self._market_open_sec <= sec < self._day_trading_exit_sec and sec <= self._market_close_sec
@@ -4,7 +4,10 @@ RealTimeMonitor의 monitor_cycle_legacy 로직을 MonitorCore.run_cycle로 이
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Dict
+import heapq
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from models.stock import StockStatus
 from utils.logger import setup_logger
 
 if TYPE_CHECKING:
@@ -18,6 +21,60 @@ class MonitorCore:
     def __init__(self, monitor: "RealTimeMonitor"):
         self.monitor = monitor  # RealTimeMonitor 인스턴스
 
+        # 🆕 주기 작업 마감시각 힙 [(다음 실행 monotonic 시각, 순번, 주기(초), 작업)]
+        #    첫 사이클에서 생성 (모니터링 주기 변경과 무관하게 실제 경과 시간 기준으로 실행)
+        self._periodic_tasks: Optional[List[Tuple[float, int, float, Callable[[], None]]]] = None
+
+        # 장외/점심시간 대기 로그 다음 출력 시각 (monotonic) – 주기 변경과 무관하게 실제 시간 기준
+        self._next_closed_log_at = 0.0
+        self._next_lunch_log_at = 0.0
+
+        # 상태 리포트용 직전 사이클 매수/매도 결과
+        self._last_buy_result: Dict[str, int] = {}
+        self._last_sell_result: Dict[str, int] = {}
+
+    def _build_periodic_tasks(self, now: float) -> List[Tuple[float, int, float, Callable[[], None]]]:
+        """설정 기반 주기 작업 힙 생성"""
+        m = self.monitor
+        tasks = [
+            # 🔥 설정 기반 성능 로깅 주기
+            (m._perf_log_secs, m._log_performance_metrics),
+            # 🔥 설정 기반 정체된 주문 타임아웃 체크
+            (m._stuck_check_secs, m._check_stuck_orders),
+            # 🔥 설정 기반 주기적 상태 리포트
+            (m._status_report_secs,
+             lambda: m._log_status_report(self._last_buy_result, self._last_sell_result)),
+            # 🔥 주기적 메모리 정리 (1시간마다)
+            (3600, m._cleanup_expired_data),
+        ]
+        heap = [(now + interval, seq, interval, fn) for seq, (interval, fn) in enumerate(tasks)]
+        heapq.heapify(heap)
+        return heap
+
+    def _run_due_tasks(self):
+        """마감시각이 지난 주기 작업 실행 후 다음 마감시각으로 재등록"""
+        now = time.monotonic()
+        heap = self._periodic_tasks
+        if heap is None:
+            self._periodic_tasks = self._build_periodic_tasks(now)
+            return
+
+        while heap and heap[0][0] <= now:
+            _, seq, interval, fn = heapq.heappop(heap)
+            try:
+                fn()
+            except Exception as e:
+                logger.error(f"주기 작업 실행 오류: {e}")
+            heapq.heappush(heap, (now + interval, seq, interval, fn))
+
+    def _snapshot_positions(self) -> Dict[StockStatus, List]:
+        """사이클 스냅샷: 매도 대상 보유 상태 + (신규 진입 가능 시) WATCHING 종목 일괄 조회"""
+        m = self.monitor
+        statuses = list(m.sell_runner.STATUSES)
+        if m.buy_runner.entries_open():
+            statuses.append(StockStatus.WATCHING)
+        return m.stock_manager.get_stocks_by_status_batch(statuses)
+
     def run_cycle(self):
         """메인 모니터링 사이클 (기존 monitor_cycle_legacy 로직)"""
         # 🔥 동시 실행 방지 (스레드 안전성 보장)
@@ -27,7 +84,16 @@ class MonitorCore:
             logger.debug("⚠️ 이전 monitor_cycle() 아직 실행 중 - 이번 사이클 건너뜀")
             return
         
+        # 🔥 종료 요청 이벤트 (stop_monitoring 시 set)
+        shutdown_requested = self.monitor._shutdown_requested
+        
         try:
+            if shutdown_requested.is_set():
+                return
+            
+            # 🔥 사이클 기준 시각/시장 단계 1회 계산 (이후 get_market_phase 는 캐시 사용)
+            self.monitor._begin_cycle()
+            
             # 통계 증가 (StatsTracker 사용)
             self.monitor.stats_tracker.inc_market_scan()
             scan_count = self.monitor.stats_tracker.market_scan_count
@@ -35,23 +101,30 @@ class MonitorCore:
             # 시장 상황 확인 및 모니터링 주기 조정
             self.monitor.adjust_monitoring_frequency()
             
-            # 테스트 모드 설정 (config에서 로드)
-            test_mode = self.monitor.strategy_config.get('test_mode', True)
+            # 테스트 모드 설정 (초기화 시 config에서 로드)
+            test_mode = self.monitor._test_mode
 
             #self.monitor._check_and_run_intraday_scan()
             
             if not test_mode:
                 # 실제 운영 모드: 시장시간 체크
                 if not self.monitor.is_market_open():
-                    if scan_count % 60 == 0:  # 10분마다 로그
+                    now_mono = time.monotonic()
+                    if now_mono >= self._next_closed_log_at:  # 10분마다 로그
+                        self._next_closed_log_at = now_mono + 600
                         logger.info("시장 마감 - 대기 중...")
+                    # 장외에는 매수/매도/스캔/구독/주기 작업을 모두 건너뛰고
+                    # 16:00 일일 리포트 확인만 수행 (monotonic 비교 1회, 15:30 장 마감 이후 시각이라 여기서 확인해야 함)
+                    self.monitor._check_and_log_daily_report()
                     return
                 
                 # 거래 시간이 아니면 모니터링만
                 if not self.monitor.is_trading_time():
                     market_phase = self.monitor.get_market_phase()
                     if market_phase == 'lunch':
-                        if scan_count % 30 == 0:  # 5분마다 로그
+                        now_mono = time.monotonic()
+                        if now_mono >= self._next_lunch_log_at:  # 5분마다 로그
+                            self._next_lunch_log_at = now_mono + 300
                             logger.info("점심시간 - 모니터링만 실행")
                     elif market_phase == 'closing':
                         logger.info("장 마감 시간 - 보유 포지션 정리 중...")
@@ -59,48 +132,39 @@ class MonitorCore:
                     return
             else:
                 # 테스트 모드: 시간 제한 없이 실행
-                test_mode_log_interval = self.monitor.strategy_config.get('test_mode_log_interval_cycles', 100)
-                if scan_count % test_mode_log_interval == 0:  # 설정 기반 테스트 모드 알림
+                if scan_count % self.monitor._test_mode_log_every == 0:  # 설정 기반 테스트 모드 알림
                     logger.info("🧪 테스트 모드 실행 중 - 시장시간 무관하게 매수/매도 분석 진행")
             
-            # 🔥 설정 기반 성능 로깅 주기 (정확한 시간 간격 계산)
-            performance_log_seconds = self.monitor.strategy_config.get('performance_log_interval_minutes', 5) * 60
-            performance_check_interval = max(1, round(performance_log_seconds / self.monitor.current_monitoring_interval))
-            if scan_count % performance_check_interval == 0:
-                self.monitor._log_performance_metrics()
+            # 🔥 매수/매도 대상 종목을 상태 락 1회로 일괄 조회 (사이클 스냅샷, 두 단계가 공유)
+            positions_by_status = self._snapshot_positions()
             
             # 매수 준비 종목 처리
-            buy_result = self.monitor.process_buy_ready_stocks()
+            buy_result = self.monitor.process_buy_ready_stocks(positions_by_status)
+            
+            # 종료 요청 시 이후 단계는 건너뛰고 빠르게 반환
+            if shutdown_requested.is_set():
+                return
             
             # 매도 준비 종목 처리  
-            sell_result = self.monitor.process_sell_ready_stocks()
+            sell_result = self.monitor.process_sell_ready_stocks(positions_by_status)
+            
+            if shutdown_requested.is_set():
+                return
             
             # 🆕 장중 추가 종목 스캔
             self.monitor._check_and_run_intraday_scan()
             
-            # 🔥 백그라운드 장중 스캔 결과 처리 (큐 기반 스레드 안전)
+            # 🔥 백그라운드 장중 스캔 결과 처리 (완료 콜백 deque 소진, 스레드 안전)
             self.monitor._process_background_scan_results()
             
             # 🔥 대기 중인 웹소켓 구독 처리 (메인 스레드에서 안전하게 처리)
             self.monitor.sub_manager.process_pending()
             
-            # 🔥 설정 기반 정체된 주문 타임아웃 체크 (정확한 시간 간격 계산)
-            stuck_order_check_seconds = self.monitor.strategy_config.get('stuck_order_check_interval_seconds', 30)
-            stuck_order_check_interval = max(1, round(stuck_order_check_seconds / self.monitor.current_monitoring_interval))
-            if scan_count % stuck_order_check_interval == 0:
-                self.monitor._check_stuck_orders()
-            
-            # 🔥 설정 기반 주기적 상태 리포트 (정확한 시간 간격 계산)
-            status_report_seconds = self.monitor.strategy_config.get('status_report_interval_minutes', 1) * 60
-            status_report_interval = max(1, round(status_report_seconds / self.monitor.current_monitoring_interval))
-            if scan_count % status_report_interval == 0:
-                self.monitor._log_status_report(buy_result, sell_result)
-            
-            # 🔥 주기적 메모리 정리 (1시간마다)
-            memory_cleanup_seconds = 3600
-            memory_cleanup_interval = max(1, round(memory_cleanup_seconds / self.monitor.current_monitoring_interval))
-            if scan_count % memory_cleanup_interval == 0:
-                self.monitor._cleanup_expired_data()
+            # 🔥 주기 작업 (성능 로깅 / 정체 주문 체크 / 상태 리포트 / 메모리 정리)
+            #    마감시각 힙에서 도래한 작업만 실행
+            self._last_buy_result = buy_result
+            self._last_sell_result = sell_result
+            self._run_due_tasks()
                 
             # 🔥 16:00 보고서 자동 출력
             self.monitor._check_and_log_daily_report()
@@ -108,6 +172,7 @@ class MonitorCore:
         except Exception as e:
             logger.error(f"모니터링 사이클 오류: {e}")
         finally:
+            self.monitor._end_cycle()
             # 🔥 반드시 락 해제 (예외 발생시에도)
             if lock_acquired:
                 self.monitor._cycle_lock.release()
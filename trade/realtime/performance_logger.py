@@ -1,13 +1,17 @@
 """performance_logger.py – 상태/최종 리포트 및 metrics 저장 (스캐폴드)"""
 
+import time
 from typing import Any, Dict, TYPE_CHECKING
 
 from utils.korean_time import now_kst
-from utils.logger import setup_logger
+from utils.logger import setup_logger, is_info_enabled
 
 
 logger = setup_logger(__name__)
 
+# 일일 리포트 자동 기록 시각 (자정 기준 초)
+_DAILY_REPORT_SEC = 16 * 3600  # 16:00
+
 
 class PerformanceLogger:
     """RealTimeMonitor 의 성과 및 상태 리포트를 담당하는 헬퍼"""
@@ -18,13 +22,19 @@ class PerformanceLogger:
 
         self.monitor = monitor  # type: ignore
 
+        # 다음 일일 리포트 확인 monotonic 시각 – 그 전에는 시각 조회 없이 즉시 반환
+        self._next_report_check = 0.0
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def log_status_report(self, buy_result: Dict[str, int], sell_result: Dict[str, int]):
         """monitor._log_status_report 기능 이관"""
+        # INFO 비활성 시 웹소켓 요약 조회/문자열 생성 전체 생략
+        if not is_info_enabled():
+            return
         try:
-            current_time = now_kst().strftime("%H:%M:%S")
+            current_time = self.monitor.cycle_now().strftime("%H:%M:%S")
             market_phase = self.monitor.get_market_phase()
 
             websocket_status = self.monitor._get_websocket_status_summary()
@@ -42,20 +52,29 @@ class PerformanceLogger:
     def log_final_performance(self):
         """monitor._log_final_performance 기능 이관"""
         try:
-            logger.info("=" * 60)
-            logger.info("📊 최종 성능 리포트")
-            logger.info("=" * 60)
             st = self.monitor.stats_tracker
-            logger.info(f"총 스캔 횟수: {st.market_scan_count:,}회")
-            logger.info(f"매수 신호 감지: {st.buy_signals_detected}건")
-            logger.info(f"매도 신호 감지: {st.sell_signals_detected}건")
-            logger.info(f"주문 실행: {st.orders_executed}건")
+
+            # 🆕 활동이 전혀 없으면(중단된 시작, 테스트 실행 등) 거래 통계 조회/저장 생략
+            if (st.orders_executed == 0 and st.buy_signals_detected == 0
+                    and st.sell_signals_detected == 0):
+                logger.info(f"📊 최종 성능 리포트: 활동 없음 (스캔 {st.market_scan_count:,}회)")
+                return
 
             trade_stats = self.monitor.trade_executor.get_trade_statistics()
-            logger.info(
+
+            # 리포트 본문은 한 번의 logger 호출로 출력 (핸들러 락/쓰기 1회)
+            separator = "=" * 60
+            logger.info("\n".join([
+                separator,
+                "📊 최종 성능 리포트",
+                separator,
+                f"총 스캔 횟수: {st.market_scan_count:,}회",
+                f"매수 신호 감지: {st.buy_signals_detected}건",
+                f"매도 신호 감지: {st.sell_signals_detected}건",
+                f"주문 실행: {st.orders_executed}건",
                 f"거래 성과: 승률 {trade_stats['win_rate']:.1f}%, "
-                f"총 손익 {trade_stats['total_pnl']:+,.0f}원"
-            )
+                f"총 손익 {trade_stats['total_pnl']:+,.0f}원",
+            ]))
 
             # metrics_daily 저장
             try:
@@ -77,20 +96,31 @@ class PerformanceLogger:
                 database.save_daily_summary(now_kst().date())
                 logger.info("📈 metrics_daily / daily_summaries 저장 완료")
 
-            logger.info("=" * 60)
+            logger.info(separator)
         except Exception as e:
             logger.error(f"최종 성능 리포트 오류: {e}")
 
     def check_and_log_daily_report(self):
-        """monitor._check_and_log_daily_report 기능 이관"""
-        try:
-            from datetime import time as dt_time
+        """monitor._check_and_log_daily_report 기능 이관
 
+        매 사이클 호출되지만 16:00 전(또는 당일 기록 후)에는 monotonic 비교 1회로 끝난다.
+        """
+        mono = time.monotonic()
+        if mono < self._next_report_check:
+            return
+        try:
             current_dt = now_kst()
-            if current_dt.time() >= dt_time(16, 0):
+            sec = current_dt.hour * 3600 + current_dt.minute * 60 + current_dt.second
+            if sec >= _DAILY_REPORT_SEC:
                 today_str = current_dt.strftime("%Y%m%d")
-                if getattr(self.monitor, "_daily_report_logged", None) != today_str:
+                if self.monitor._daily_report_logged != today_str:
                     self.log_final_performance()
                     self.monitor._daily_report_logged = today_str
+                    # 다음 거래일 첫 장중 스캔은 다시 08:40 기준으로 대기
+                    self.monitor.scan_worker.reset_daily()
+                # 다음 확인은 익일 16:00
+                self._next_report_check = mono + (86400 - sec + _DAILY_REPORT_SEC)
+            else:
+                self._next_report_check = mono + (_DAILY_REPORT_SEC - sec)
         except Exception as e:
             logger.error(f"일일 리포트 자동 기록 오류: {e}") 
\ No newline at end of file
@@ -1,19 +1,19 @@
 """IntradayScanWorker – 장중 추가 종목 스캔을 담당.
 
-RealTimeMonitor 에서 호출되며, 종목 스캔을 별도 스레드에서 수행하고
+RealTimeMonitor 에서 호출되며, 종목 스캔을 전용 단일 워커 스레드에서 수행하고
 결과를 메인 스레드가 안전하게 수신·처리할 수 있게 해 준다.
 """
 
 from __future__ import annotations
 
-import threading
 import time
-import queue
-from datetime import time as dt_time
-from typing import Any, Optional, Tuple, List, TYPE_CHECKING
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional, Tuple, List, TYPE_CHECKING
 
 from utils.korean_time import now_kst
-from utils.logger import setup_logger
+from utils.logger import setup_logger, is_info_enabled
+from utils.stock_data_loader import get_stock_data_loader
 
 # 순환 참조 방지를 위한 타입 힌트 전용 import
 if TYPE_CHECKING:
@@ -21,6 +21,9 @@ if TYPE_CHECKING:
 
 logger = setup_logger(__name__)
 
+# 당일 최초 장중 스캔 허용 시각 (자정 기준 초)
+_FIRST_SCAN_SEC = 8 * 3600 + 40 * 60  # 08:40
+
 
 class IntradayScanWorker:
     def __init__(self, monitor: "RealTimeMonitor"):
@@ -35,8 +38,23 @@ class IntradayScanWorker:
 
         # 내부 상태
         self._market_scanner_instance = None
-        self._result_queue: Optional["queue.Queue[Tuple[str, Any]]"] = None
-        self._scan_thread: Optional[threading.Thread] = None
+        # 스캔 실행: 스캔마다 스레드를 새로 만들지 않고 단일 워커 executor 재사용 (최초 스캔 시 생성)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 진행 중인 스캔
+        self._scan_future: Optional["Future[Tuple[str, Any]]"] = None
+        # 완료된 스캔 – 워커의 done 콜백이 append, 메인 루프가 popleft 로 소진
+        self._completed_scans: Deque["Future[Tuple[str, Any]]"] = deque()
+
+        # 종목 수 한도 (설정 기반, 최초 사용 시 1회 계산 – monitor 설정 로드 이후)
+        self._effective_max_stocks: Optional[int] = None
+
+        # 마지막 스캔 시각 (표시용 KST / 주기 계산용 monotonic)
+        self.last_scan_time = None
+        self._last_scan_monotonic: Optional[float] = None
+
+        # 당일 첫 스캔 여부 / 첫 스캔 허용 monotonic 시각 (08:40 까지 남은 시간으로 1회 계산)
+        self._first_scan_done = False
+        self._first_scan_not_before: Optional[float] = None
 
     # ------------------------------------------------------------------
     # public API
@@ -44,7 +62,22 @@ class IntradayScanWorker:
     def check_and_run_scan(self):
         """RealTimeMonitor.monitor_cycle 에서 호출"""
         try:
-            cfg = self.monitor.performance_config
+            # 이전 스캔이 실행 중이거나 결과가 아직 처리되지 않았으면 중복 실행하지 않음
+            if self._completed_scans or (self._scan_future is not None and not self._scan_future.done()):
+                return
+
+            # 스캔 주기 체크를 가장 먼저 (대부분의 사이클은 monotonic 비교 1회로 종료)
+            now_mono = time.monotonic()
+            if self._first_scan_done:
+                if now_mono - self._last_scan_monotonic < self.monitor.intraday_scan_interval:
+                    return
+            else:
+                # 최초 스캔은 08:40 이후 – 허용 시각은 1회만 계산하고 이후에는 monotonic 비교
+                not_before = self._first_scan_not_before
+                if not_before is None:
+                    not_before = self._first_scan_not_before = now_mono + self._seconds_until_first_scan()
+                if now_mono < not_before:
+                    return
 
             current_time = now_kst()
 
@@ -52,87 +85,133 @@ class IntradayScanWorker:
             #if current_time.time() >= self.monitor.pre_close_time:
             #    return
 
-            # 종목 수 한도 체크
-            websocket_max = cfg.get('websocket_max_connections', 41)
-            connections_per_stock = cfg.get('websocket_connections_per_stock', 2)
-            system_connections = cfg.get('websocket_system_connections', 1)
-
-            current_total_stocks = len(self.monitor.stock_manager.get_all_positions())
-            max_manageable_stocks = (websocket_max - system_connections) // connections_per_stock
-            configured_max = cfg.get('max_total_observable_stocks', 20)
-            effective_max = min(configured_max, max_manageable_stocks)
+            # 종목 수 한도 체크 (한도는 설정 로드 후 1회 계산)
+            effective_max = self._effective_max_stocks
+            if effective_max is None:
+                effective_max = self.reload_config()
 
+            current_total_stocks = self.monitor.stock_manager.position_count
             if current_total_stocks >= effective_max:
                 return
 
-            # 스캔 주기 체크
-            should_scan = False
-            if getattr(self, 'last_scan_time', None) is None:
-                first_scan_time = dt_time(8, 40)
-                if current_time.time() >= first_scan_time:
-                    should_scan = True
-            else:
-                elapsed = (current_time - self.last_scan_time).total_seconds()
-                if elapsed >= self.monitor.intraday_scan_interval:
-                    should_scan = True
-
-            if not should_scan:
-                return
-
             remaining_slots = effective_max - current_total_stocks
             max_new = min(self.monitor.max_additional_stocks, remaining_slots)
 
             logger.info(f"🔍 장중 추가 종목 스캔 시작 (추가가능:{max_new}개)")
 
-            self._result_queue = queue.Queue()
-
-            self._scan_thread = threading.Thread(
-                target=self._background_scan,
-                args=(max_new,),
-                name=f"IntradayScan-{current_time.strftime('%H%M%S')}",
-                daemon=True,
-            )
-            self._scan_thread.start()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="IntradayScan")
+            self._scan_future = self._executor.submit(self._background_scan, max_new)
+            self._scan_future.add_done_callback(self._completed_scans.append)
 
             self.last_scan_time = current_time
+            self._last_scan_monotonic = time.monotonic()
+            self._first_scan_done = True
 
         except Exception as e:
             logger.error(f"IntradayScanWorker.check_and_run_scan 오류: {e}")
 
-    def process_background_results(self):
-        """메인 루프에서 주기적으로 호출 – 결과가 준비되면 처리"""
-        if not self._result_queue:
-            return
+    def reset_daily(self):
+        """일자 변경 시 첫 스캔 대기 상태로 초기화 (다음 호출에서 08:40 기준 재계산)"""
+        self._first_scan_done = False
+        self._first_scan_not_before = None
 
-        try:
-            status, result = self._result_queue.get_nowait()
-        except queue.Empty:
-            return
+    @staticmethod
+    def _seconds_until_first_scan() -> float:
+        """현재 KST 기준 첫 스캔 허용 시각(08:40)까지 남은 초 (이미 지났으면 0)"""
+        current = now_kst()
+        elapsed = current.hour * 3600 + current.minute * 60 + current.second
+        return max(0.0, float(_FIRST_SCAN_SEC - elapsed))
+
+    def reload_config(self) -> int:
+        """performance_config 기반 종목 수 한도 재계산 (설정 재로드 시 호출)
+
+        Returns:
+            적용 한도 = min(설정 최대 종목 수, 웹소켓 연결로 관리 가능한 종목 수)
+        """
+        cfg = self.monitor.performance_config
+        websocket_max = cfg.get('websocket_max_connections', 41)
+        connections_per_stock = cfg.get('websocket_connections_per_stock', 2)
+        system_connections = cfg.get('websocket_system_connections', 1)
+
+        max_manageable_stocks = (websocket_max - system_connections) // connections_per_stock
+        configured_max = cfg.get('max_total_observable_stocks', 20)
+        self._effective_max_stocks = min(configured_max, max_manageable_stocks)
+        return self._effective_max_stocks
 
-        # queue consumed → reset
-        self._result_queue = None
-        self._scan_thread = None
+    def process_background_results(self):
+        """메인 루프에서 주기적으로 호출 – 완료된 스캔 결과를 소진하여 처리"""
+        # 완료된 스캔이 없으면 deque 길이 확인만으로 종료 (락/예외 경로 없음)
+        completed = self._completed_scans
+        if not completed:
+            return
 
-        if status == 'success':
-            self._process_scan_results(result)
-        else:
-            logger.error(f"백그라운드 장중 스캔 실패: {result}")
+        # 성공 결과는 종목코드 기준 중복 제거 후 한 번에 처리
+        combined: List[Tuple[str, float, str]] = []
+        seen = set()
+        has_success = False
+        while completed:
+            future = completed.popleft()
+            if future is self._scan_future:
+                self._scan_future = None
+            if future.cancelled():
+                continue
+
+            status, result = future.result()
+            if status != 'success':
+                logger.error(f"백그라운드 장중 스캔 실패: {result}")
+                continue
+            has_success = True
+            for entry in result or ():
+                if entry[0] not in seen:
+                    seen.add(entry[0])
+                    combined.append(entry)
+
+        if has_success:
+            self._process_scan_results(combined)
 
     # ------------------------------------------------------------------
     # internal helpers
     # ------------------------------------------------------------------
-    def _background_scan(self, max_new_stocks: int):
-        """별도 스레드: MarketScanner.intraday_scan_additional_stocks 수행"""
+    def shutdown(self):
+        """스캔 워커 종료 (모니터링 중지 시 호출) – 대기 중 스캔은 취소, 실행 중 스캔은 기다리지 않음"""
+        future = self._scan_future
+        if future is not None:
+            future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _run_on_worker(self, fn, *args) -> None:
+        """부가 작업(DB 기록 등)을 스캔 워커 스레드에 넘김 – 워커가 없으면 현재 스레드에서 실행"""
+        executor = self._executor
+        if executor is not None:
+            try:
+                executor.submit(fn, *args)
+                return
+            except RuntimeError:
+                # shutdown 직후 – 아래에서 동기 실행
+                pass
+        fn(*args)
+
+    def _background_scan(self, max_new_stocks: int) -> Tuple[str, Any]:
+        """워커 스레드: MarketScanner.intraday_scan_additional_stocks 수행 → (상태, 결과) 반환"""
         try:
             if self._market_scanner_instance is None:
                 from trade.market_scanner import MarketScanner
                 self._market_scanner_instance = MarketScanner(self.monitor.stock_manager)
 
             additional = self._market_scanner_instance.intraday_scan_additional_stocks(max_stocks=max_new_stocks)
-            self._result_queue.put(('success', additional))  # type: ignore[arg-type]
+            return ('success', additional)
         except Exception as e:
             logger.error(f"백그라운드 장중 스캔 오류: {e}")
-            self._result_queue.put(('error', str(e)))  # type: ignore[arg-type]
+            return ('error', str(e))
+
+    @staticmethod
+    def _fetch_stock_names(codes: List[str]) -> Dict[str, Optional[str]]:
+        """후보 종목명 일괄 조회 (로컬 종목 마스터 – 네트워크 호출 없음)"""
+        loader = get_stock_data_loader()
+        return {code: loader.get_stock_name(code) for code in codes}
 
     def _process_scan_results(self, additional_stocks: List[Tuple[str, float, str]]):
         """스캔 이후 메인 스레드 처리"""
@@ -143,17 +222,20 @@ class IntradayScanWorker:
 
             logger.info(f"🎯 장중 추가 종목 후보 {len(additional_stocks)}개 발견:")
 
+            # 종목명은 후보 전체를 먼저 일괄 조회 (종목별 로더 조회/import 반복 제거)
+            names = self._fetch_stock_names([code for code, _, _ in additional_stocks])
+
+            log_info = is_info_enabled()
             added_cnt = 0
+            scan_rows: List[Tuple[str, Optional[str], float, str]] = []
             for i, (code, score, reasons) in enumerate(additional_stocks, 1):
                 try:
-                    from utils.stock_data_loader import get_stock_data_loader
-                    name = get_stock_data_loader().get_stock_name(code)
+                    name = names.get(code)
 
-                    logger.info(f"  {i}. {code}[{name}] - 점수:{score:.1f} ({reasons})")
+                    if log_info:
+                        logger.info(f"  {i}. {code}[{name}] - 점수:{score:.1f} ({reasons})")
 
-                    db = self.monitor.stock_manager._get_database()
-                    if db:
-                        db.save_intraday_scan_result(code, name, score, reasons)
+                    scan_rows.append((code, name, score, reasons))
 
                     success = self.monitor._add_intraday_stock_safely(code, name, score, reasons)
                     if success:
@@ -161,6 +243,12 @@ class IntradayScanWorker:
                 except Exception as inner_e:
                     logger.error(f"장중 종목 추가 오류 {code}: {inner_e}")
 
+            # 스캔 결과 DB 기록은 루프 종료 후 단일 트랜잭션으로 일괄 저장
+            # (행 구성 시 현재가 API 조회가 섞이므로 모니터 사이클이 아닌 스캔 워커 스레드에서 수행)
+            db = self.monitor.stock_manager._get_database()
+            if db and scan_rows:
+                self._run_on_worker(db.save_intraday_scan_results_batch, scan_rows)
+
             if added_cnt:
                 summary = self.monitor.stock_manager.get_intraday_summary()
                 logger.info(
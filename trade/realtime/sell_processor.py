@@ -8,7 +8,7 @@ from __future__ import annotations
 from typing import Dict, Optional, TYPE_CHECKING, Any
 from datetime import datetime
 
-from models.stock import Stock
+from models.stock import Stock, RealtimeData
 from utils.korean_time import now_kst
 from utils.logger import setup_logger
 
@@ -36,7 +36,12 @@ class SellProcessor:
         self.performance_config: Dict[str, Any] = performance_config
         self.risk_config: Dict[str, Any] = risk_config
 
-    def _determine_sell_price(self, realtime_data: Dict[str, Any]) -> float:
+        # 🆕 종목마다 조회하던 설정값 사전 계산
+        self._data_max_age: float = performance_config.get("data_max_age", 2)
+        self._trailing_stop_enabled: bool = performance_config.get('trailing_stop_enabled', False)
+        self._trailing_stop_ratio: float = performance_config.get('trailing_stop_ratio', 1.0)
+
+    def _determine_sell_price(self, realtime_data: RealtimeData, now: Optional[datetime] = None) -> float:
         """매도 주문가를 계산하여 반환한다.
 
         1) 매도 1호가(ask_price)와 현재가(current_price) 중 더 높은 값을 사용해
@@ -44,8 +49,8 @@ class SellProcessor:
         2) 두 값 모두 유효(>0)가 아닐 때는 0 을 반환하여 주문을 건너뛴다.
         3) (옵션) 실시간 데이터가 너무 오래됐으면 0 반환 – data_max_age(sec) 설정.
         """
-        ask_price = realtime_data.get("ask_price") or 0
-        current_price = realtime_data.get("current_price") or 0
+        ask_price = realtime_data.ask_price or 0
+        current_price = realtime_data.current_price or 0
 
         # 두 값 중 더 높은 값 선택
         price = max(ask_price, current_price)
@@ -55,10 +60,9 @@ class SellProcessor:
             return 0
 
         # 추가 안전장치: 데이터 신선도 확인 (기본 2초)
-        last_ts = realtime_data.get("last_updated") or realtime_data.get("timestamp")
+        last_ts = realtime_data.last_updated
         if isinstance(last_ts, datetime):
-            max_age = self.performance_config.get("data_max_age", 2)
-            if (now_kst() - last_ts).total_seconds() > max_age:
+            if ((now if now is not None else now_kst()) - last_ts).total_seconds() > self._data_max_age:
                 # 데이터가 너무 오래됨 → 주문 보류
                 return 0
 
@@ -70,36 +74,36 @@ class SellProcessor:
     def analyze_sell_conditions(
         self,
         stock: Stock,
-        realtime_data: Dict[str, Any],
         market_phase: Optional[str] = None,
     ) -> Optional[str]:
         return self.condition_analyzer.analyze_sell_conditions(
-            stock, realtime_data, market_phase
+            stock, stock.realtime_data, market_phase
         )
 
     def analyze_and_sell(
         self,
         stock: Stock,
-        realtime_data: Dict[str, Any],
         result_dict: Dict[str, int],
         market_phase: Optional[str] = None,
+        now: Optional[datetime] = None,
     ) -> bool:
-        """조건 분석 후 매도 주문 실행 및 result 수치 업데이트"""
+        """조건 분석 후 매도 주문 실행 및 result 수치 업데이트 (now: 사이클 기준 시각, 옵션)"""
         try:
+            realtime_data = stock.realtime_data
+
             # 🆕 트레일링 스탑 목표가 갱신 (설정에 따라)
-            if self.performance_config.get('trailing_stop_enabled', False):
-                trail_ratio = self.performance_config.get('trailing_stop_ratio', 1.0)
-                current_price = realtime_data.get('current_price', 0)
+            if self._trailing_stop_enabled:
+                current_price = realtime_data.current_price
                 if current_price > 0:
-                    stock.update_trailing_target(trail_ratio, current_price)
+                    stock.update_trailing_target(self._trailing_stop_ratio, current_price)
 
-            sell_reason = self.analyze_sell_conditions(stock, realtime_data, market_phase)
+            sell_reason = self.analyze_sell_conditions(stock, market_phase)
             if not sell_reason:
                 return False
 
             result_dict['signaled'] += 1
 
-            price = self._determine_sell_price(realtime_data)
+            price = self._determine_sell_price(realtime_data, now)
             if price <= 0:
                 return False
 
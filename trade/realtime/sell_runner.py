@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
+from models.stock import StockStatus
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 if TYPE_CHECKING:
     from trade.realtime_monitor import RealTimeMonitor
+    from datetime import datetime
+    from models.stock import Stock
+
+# 매도 판단 대상 보유 상태 (조회·처리 순서 유지)
+_HOLDING_STATUSES = [StockStatus.BOUGHT, StockStatus.PARTIAL_BOUGHT, StockStatus.PARTIAL_SOLD]
 
 
 class SellRunner:
@@ -16,48 +22,70 @@ class SellRunner:
     def __init__(self, monitor: "RealTimeMonitor") -> None:
         self.m = monitor
 
-    def run(self) -> Dict[str, int]:
+    # 매도 판단에 필요한 상태 (사이클 스냅샷 구성용)
+    STATUSES = tuple(_HOLDING_STATUSES)
+
+    def run(self, positions_by_status: Optional[Dict[StockStatus, List["Stock"]]] = None) -> Dict[str, int]:
+        """보유 종목 매도 처리 후 결과 dict 반환.
+
+        Args:
+            positions_by_status: 사이클 시작 시 일괄 조회한 상태별 종목 (보유 상태가 빠져 있으면 직접 조회)
+        """
         result: Dict[str, int] = {"checked": 0, "signaled": 0, "ordered": 0}
-        from models.stock import StockStatus  # local import
 
         try:
-            holding = (
-                self.m.stock_manager.get_stocks_by_status(StockStatus.BOUGHT)
-                + self.m.stock_manager.get_stocks_by_status(StockStatus.PARTIAL_BOUGHT)
-                + self.m.stock_manager.get_stocks_by_status(StockStatus.PARTIAL_SOLD)
-            )
+            # 보유 상태 3종을 상태 락 1회로 일괄 조회 (사이클 스냅샷이 있으면 재사용)
+            batch = positions_by_status
+            if batch is None or any(status not in batch for status in _HOLDING_STATUSES):
+                batch = self.m.stock_manager.get_stocks_by_status_batch(_HOLDING_STATUSES)
+            holding = [stk for status in _HOLDING_STATUSES for stk in batch[status]]
             if not holding:
                 return result
 
-            rt_dict = {}
-            for stk in holding:
-                try:
-                    rt = self.m.get_realtime_data(stk.stock_code)
-                    if rt:
-                        rt_dict[stk.stock_code] = rt
-                except Exception as exc:
-                    logger.debug(f"실시간 데이터 조회 실패 {stk.stock_code}: {exc}")
-
-            for stk in holding:
-                result["checked"] += 1
-                rt = rt_dict.get(stk.stock_code)
-                if not rt:
-                    continue
-                try:
-                    prev_sig = result["signaled"]
-                    success = self.m.sell_processor.analyze_and_sell(
-                        stock=stk,
-                        realtime_data=rt,
-                        result_dict=result,
-                        market_phase=self.m.get_market_phase(),
-                    )
-                    if result["signaled"] > prev_sig:
-                        self.m.stats_tracker.inc_sell_signal()
-                        if success:
-                            self.m.stats_tracker.inc_sell_order()
-                        self.m.alert_sent.discard(f"{stk.stock_code}_buy")
-                except Exception as exc:
-                    logger.error(f"매도 처리 오류 {stk.stock_code}: {exc}")
+            # 시장 단계는 사이클당 1회만 조회
+            market_phase = self.m.get_market_phase()
+            cycle_now = self.m.cycle_now()
+
+            # 현재가 없는 종목은 워커에 넘기기 전에 한 번에 제외
+            result["checked"] = len(holding)
+            candidates = [stk for stk in holding if stk.realtime_data.current_price > 0]
+            if not candidates:
+                return result
+
+            # 종목별 분석·주문은 서로 독립 → 사이클 워커 풀에서 병렬 처리 후 집계
+            outcomes = self.m.map_stocks(
+                lambda stk: self._process_one(stk, market_phase, cycle_now),
+                candidates,
+            )
+            for signaled, ordered in outcomes:
+                result["signaled"] += signaled
+                result["ordered"] += ordered
         except Exception as exc:
             logger.error(f"매도 준비 종목 처리 오류: {exc}")
-        return result 
\ No newline at end of file
+        return result
+
+    def _process_one(self, stk: "Stock", market_phase: str, cycle_now: "datetime") -> Tuple[int, int]:
+        """단일 종목 매도 판단 → 주문 (워커 스레드에서 실행될 수 있음)
+
+        입력은 run() 에서 현재가 유효 종목으로 사전 검증된 상태.
+        예외는 종목 단위로 격리 (한 종목 오류가 풀 결과 집계 전체를 중단시키지 않도록).
+
+        Returns:
+            (신호 수, 주문 수) – 종목별 로컬 집계 후 호출 측에서 합산
+        """
+        local = {"signaled": 0, "ordered": 0}
+        try:
+            success = self.m.sell_processor.analyze_and_sell(
+                stock=stk,
+                result_dict=local,
+                market_phase=market_phase,
+                now=cycle_now,
+            )
+            if local["signaled"]:
+                self.m.stats_tracker.inc_sell_signal()
+                if success:
+                    self.m.stats_tracker.inc_sell_order()
+                self.m.clear_alert(stk.stock_code)
+        except Exception as exc:
+            logger.error(f"매도 처리 오류 {stk.stock_code}: {exc}")
+        return local["signaled"], local["ordered"] 
\ No newline at end of file
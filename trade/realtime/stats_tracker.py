@@ -4,6 +4,27 @@ import threading
 from typing import Dict
 
 
+class AtomicCounter:
+    """락으로 보호되는 단조 증가 카운터.
+
+    증가는 락 안에서 ``+=`` 로 수행하고, 조회는 마지막으로 기록된 int 값을 그대로 읽는다.
+    """
+
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def inc(self) -> None:
+        with self._lock:
+            self.value += 1
+
+    def add(self, n: int) -> None:
+        with self._lock:
+            self.value += n
+
+
 class StatsTracker:
     """모니터링 통계(스캔 횟수, 신호, 주문 체결 등)를
     스레드 안전하게 기록·조회하기 위한 헬퍼 클래스입니다.
@@ -11,81 +32,76 @@ class StatsTracker:
     """
 
     def __init__(self):
-        self._lock = threading.RLock()
-        self._market_scan_count = 0
-        self._buy_signals_detected = 0
-        self._sell_signals_detected = 0
-        self._buy_orders_executed = 0
-        self._sell_orders_executed = 0
+        # 통계별 락 보호 카운터 (사이클/워커/체결통보 스레드가 함께 증가)
+        self._market_scan = AtomicCounter()
+        self._buy_signals = AtomicCounter()
+        self._sell_signals = AtomicCounter()
+        self._buy_orders = AtomicCounter()
+        self._sell_orders = AtomicCounter()
 
     # -------------------------------------------------
     # 내부 헬퍼
     # -------------------------------------------------
-    def _inc(self, attr: str, value: int = 1) -> None:
-        with self._lock:
-            setattr(self, attr, getattr(self, attr) + value)
+    def _inc(self, counter: AtomicCounter, value: int = 1) -> None:
+        if value == 1:
+            counter.inc()
+        else:
+            counter.add(value)
 
     # -------------------------------------------------
     # 증가 메소드
     # -------------------------------------------------
     def inc_market_scan(self, n: int = 1) -> None:
-        self._inc("_market_scan_count", n)
+        self._inc(self._market_scan, n)
 
     def inc_buy_signal(self, n: int = 1) -> None:
-        self._inc("_buy_signals_detected", n)
+        self._inc(self._buy_signals, n)
 
     def inc_sell_signal(self, n: int = 1) -> None:
-        self._inc("_sell_signals_detected", n)
+        self._inc(self._sell_signals, n)
 
     def inc_buy_order(self, n: int = 1) -> None:
-        self._inc("_buy_orders_executed", n)
+        self._inc(self._buy_orders, n)
 
     def inc_sell_order(self, n: int = 1) -> None:
-        self._inc("_sell_orders_executed", n)
+        self._inc(self._sell_orders, n)
 
     # -------------------------------------------------
-    # 프로퍼티 – 읽기 전용
+    # 프로퍼티 – 읽기 전용 (스냅샷 값, 락 없음)
     # -------------------------------------------------
     @property
     def market_scan_count(self) -> int:
-        with self._lock:
-            return self._market_scan_count
+        return self._market_scan.value
 
     @property
     def buy_signals_detected(self) -> int:
-        with self._lock:
-            return self._buy_signals_detected
+        return self._buy_signals.value
 
     @property
     def sell_signals_detected(self) -> int:
-        with self._lock:
-            return self._sell_signals_detected
+        return self._sell_signals.value
 
     @property
     def buy_orders_executed(self) -> int:
-        with self._lock:
-            return self._buy_orders_executed
+        return self._buy_orders.value
 
     @property
     def sell_orders_executed(self) -> int:
-        with self._lock:
-            return self._sell_orders_executed
+        return self._sell_orders.value
 
     @property
     def orders_executed(self) -> int:
-        with self._lock:
-            return self._buy_orders_executed + self._sell_orders_executed
+        return self._buy_orders.value + self._sell_orders.value
 
     # -------------------------------------------------
     # 스냅샷
     # -------------------------------------------------
     def snapshot(self) -> Dict[str, int]:
         """현재 통계 값을 딕셔너리로 반환합니다."""
-        with self._lock:
-            return {
-                "market_scan_count": self._market_scan_count,
-                "buy_signals_detected": self._buy_signals_detected,
-                "sell_signals_detected": self._sell_signals_detected,
-                "buy_orders_executed": self._buy_orders_executed,
-                "sell_orders_executed": self._sell_orders_executed,
-            } 
\ No newline at end of file
+        return {
+            "market_scan_count": self._market_scan.value,
+            "buy_signals_detected": self._buy_signals.value,
+            "sell_signals_detected": self._sell_signals.value,
+            "buy_orders_executed": self._buy_orders.value,
+            "sell_orders_executed": self._sell_orders.value,
+        }
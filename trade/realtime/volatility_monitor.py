@@ -2,11 +2,16 @@ from __future__ import annotations
 
 from typing import Optional, Any
 
+import numpy as np
+
 from utils.logger import setup_logger
 from models.stock import StockStatus
 
 logger = setup_logger(__name__)
 
+# 변동성 판단 대상 상태
+_VOLATILITY_STATUSES = (StockStatus.BOUGHT, StockStatus.WATCHING)
+
 
 class VolatilityMonitor:
     """보유/관심 종목의 변동성을 계산하여 고변동성 여부를 판단하는 헬퍼.
@@ -30,23 +35,18 @@ class VolatilityMonitor:
     def is_high_volatility(self) -> bool:
         """현재 포트폴리오가 고변동성 상태인지 여부를 반환한다."""
         try:
-            positions = self.stock_manager.get_all_positions()
-            if not positions:
+            # 분모는 전체 관리 종목 수 (Stock 목록 생성 없이 카운터 조회)
+            total = self.stock_manager.position_count
+            if not total:
                 return False
 
-            high_count = 0
-            for pos in positions:
-                if pos.status not in (StockStatus.BOUGHT, StockStatus.WATCHING):
-                    continue
-                current_price = pos.realtime_data.current_price
-                ref_price = pos.reference_data.yesterday_close
-                if ref_price <= 0:
-                    continue
-                change_pct = abs((current_price - ref_price) / ref_price)
-                if change_pct >= self.volatility_threshold:
-                    high_count += 1
-
-            return high_count >= len(positions) * self.high_volatility_position_ratio
+            # BOUGHT/WATCHING 종목의 현재가·전일종가 배열로 변동률 일괄 계산
+            prices, ref_prices = self.stock_manager.get_price_reference_arrays(_VOLATILITY_STATUSES)
+            valid = ref_prices > 0
+            change_pct = np.abs((prices[valid] - ref_prices[valid]) / ref_prices[valid])
+            high_count = int(np.count_nonzero(change_pct >= self.volatility_threshold))
+
+            return high_count >= total * self.high_volatility_position_ratio
         except Exception as exc:
             logger.error(f"고변동성 계산 오류: {exc}")
             return False 
\ No newline at end of file
@@ -11,10 +11,10 @@ SubscriptionManager 는 RealTimeMonitor 로부터 전달받은 종목을
 
 from __future__ import annotations
 
-import time
-from typing import Set, Dict, Any, List
+from collections import deque
+from typing import Deque, Set, Dict, Any, List, Optional
 
-from utils.logger import setup_logger
+from utils.logger import setup_logger, is_debug_enabled, is_info_enabled
 
 logger = setup_logger(__name__)
 
@@ -22,47 +22,74 @@ class SubscriptionManager:
     def __init__(self, monitor: "Any"):
         self.monitor = monitor  # RealTimeMonitor 참조 (타입 회피)
 
-        self.pending: Set[str] = set()
+        # 구독 대기열: FIFO 순서(deque) + 중복 방지용 멤버십 set
+        self.pending: Deque[str] = deque()
+        self._pending_set: Set[str] = set()
         self.retry_count: Dict[str, int] = {}
 
+        # 배치 크기 / 종목당 구독 시간 한도 (설정 기반, 최초 사용 시 1회 계산 – monitor 설정 로드 이후)
+        self._batch_size: Optional[int] = None
+        self._timeout_per_stock: float = 2.0
+
     # ------------------------------------------------------------------
     # public API
     # ------------------------------------------------------------------
     def add_pending(self, stock_code: str):
-        self.pending.add(stock_code)
+        if stock_code not in self._pending_set:
+            self._pending_set.add(stock_code)
+            self.pending.append(stock_code)
+
+    def reload_config(self) -> int:
+        """performance_config 기반 배치 설정 재계산 (설정 재로드 시 호출)
+
+        Returns:
+            배치당 최대 구독 종목 수
+        """
+        cfg = self.monitor.performance_config
+        self._batch_size = cfg.get('websocket_subscription_batch_size', 3)
+        self._timeout_per_stock = cfg.get('websocket_subscription_timeout_per_stock', 2.0)
+        return self._batch_size
 
     def process_pending(self):
         if not self.pending:
             return
 
-        cfg = self.monitor.performance_config
-        max_batch_size = cfg.get('websocket_subscription_batch_size', 3)
-        batch = list(self.pending)[:max_batch_size]
-        for code in batch:
-            self.pending.discard(code)
+        max_batch_size = self._batch_size
+        if max_batch_size is None:
+            max_batch_size = self.reload_config()
+        pending = self.pending
+        batch = [pending.popleft() for _ in range(min(max_batch_size, len(pending)))]
+        self._pending_set.difference_update(batch)
 
         if not batch:
             return
 
-        logger.debug(
-            f"📡 웹소켓 구독 배치 처리: {len(batch)}개 (대기: {len(self.pending)}개)"
-        )
+        if is_debug_enabled():
+            logger.debug(
+                f"📡 웹소켓 구독 배치 처리: {len(batch)}개 (대기: {len(self.pending)}개)"
+            )
+
+        # 상태 확인·이벤트 루프 왕복을 배치당 1회로 처리 (배치 전체 처리 시간 한도 적용)
+        max_duration = self._timeout_per_stock * len(batch)
+        results = self._add_subscriptions_safely(batch, max_duration)
 
         success_cnt = 0
         failed: List[str] = []
-
-        for code in batch:
-            start = time.time()
-            ok = self._add_subscription_safely(code)
-            elapsed = time.time() - start
-            if elapsed > 2.0:
-                logger.warning(f"⏰ 웹소켓 구독 처리 시간 초과: {code} ({elapsed:.1f}s)")
-
+        for code, ok in results.items():
             if ok:
                 success_cnt += 1
             else:
                 failed.append(code)
 
+        # 시간 한도 초과로 시도하지 못한 종목은 재시도 횟수 차감 없이 다음 배치로
+        if len(results) < len(batch):
+            deferred = [code for code in batch if code not in results]
+            for code in deferred:
+                self.add_pending(code)
+            logger.warning(
+                f"⏰ 웹소켓 구독 배치 시간 초과({max_duration:.1f}s) – {len(deferred)}개 다음 배치로 이월"
+            )
+
         self._handle_failures(failed)
 
         if success_cnt:
@@ -72,10 +99,15 @@ class SubscriptionManager:
 
     def cleanup(self):
         """retry 3회 초과 실패 항목 정리. 반환: 정리된 수"""
-        expired = [c for c, n in self.retry_count.items() if n >= 3]
-        for c in expired:
-            self.retry_count.pop(c, None)
-        return len(expired)
+        before = len(self.retry_count)
+        if not before:
+            return 0
+        # 중간 리스트 + pop 반복 대신 1회 순회로 유지 대상만 재구성
+        kept = {c: n for c, n in self.retry_count.items() if n < 3}
+        removed = before - len(kept)
+        if removed:
+            self.retry_count = kept
+        return removed
 
     # ------------------------------------------------------------------
     # internal helpers
@@ -83,56 +115,72 @@ class SubscriptionManager:
     def _handle_failures(self, failed: List[str]):
         if not failed:
             return
+        log_debug = is_debug_enabled()
         for code in failed:
             n = self.retry_count.get(code, 0)
             if n < 3:
-                self.pending.add(code)
+                self.add_pending(code)
                 self.retry_count[code] = n + 1
-                logger.debug(
-                    f"🔄 웹소켓 구독 재시도 대기열 추가: {code} ({n + 1}/3)"
-                )
+                if log_debug:
+                    logger.debug(
+                        f"🔄 웹소켓 구독 재시도 대기열 추가: {code} ({n + 1}/3)"
+                    )
             else:
                 logger.error(f"❌ 웹소켓 구독 최대 재시도 초과: {code} – 포기")
                 self.retry_count.pop(code, None)
 
-    def _add_subscription_safely(self, stock_code: str) -> bool:
-        """실제 subscribe_stock_sync 호출 로직 (기존 코드 이동)"""
+    def _add_subscriptions_safely(self, codes: List[str], max_duration: Optional[float] = None) -> Dict[str, bool]:
+        """subscribe_stocks_sync 일괄 호출
+
+        연결/이벤트 루프/기구독/한도 확인은 subscribe_stocks_sync 내부 경로가 처리하므로
+        정상 경로에서는 사전 점검 없이 바로 호출한다. 실패 원인 상세 점검은 DEBUG 로그 활성 시에만 수행.
+
+        Returns:
+            {종목코드: 구독 성공 여부} (시간 한도로 시도하지 못한 종목은 제외)
+        """
+        results: Dict[str, bool] = {code: False for code in codes}
+        websocket_manager = self.monitor.stock_manager.websocket_manager
+        if not websocket_manager:
+            logger.debug(f"웹소켓 매니저 없음 – 구독 생략: {len(codes)}개")
+            return results
+
+        try:
+            attempted = websocket_manager.subscribe_stocks_sync(codes, max_duration=max_duration)
+        except Exception as e:
+            logger.error(f"웹소켓 일괄 구독 오류 {codes}: {e}")
+            return results
+
+        for code in codes:
+            if code not in attempted:
+                results.pop(code, None)
+
+        failed: List[str] = []
+        log_info = is_info_enabled()
+        for code, ok in attempted.items():
+            results[code] = ok
+            if ok:
+                if log_info:
+                    logger.info(f"📡 웹소켓 구독 추가 성공: {code}")
+            else:
+                failed.append(code)
+
+        if failed:
+            logger.warning(f"웹소켓 구독 실패: {failed}")
+            if is_debug_enabled():
+                self._log_subscription_diagnostics(websocket_manager, failed)
+        return results
+
+    @staticmethod
+    def _log_subscription_diagnostics(websocket_manager: Any, failed: List[str]):
+        """구독 실패 원인 점검 (DEBUG 전용 – 건강성/연결/이벤트 루프/한도)"""
         try:
-            websocket_manager = getattr(self.monitor.stock_manager, 'websocket_manager', None)
-            if not websocket_manager:
-                logger.debug(f"웹소켓 매니저 없음 – 구독 생략: {stock_code}")
-                return False
-
-            if not websocket_manager.is_websocket_healthy():
-                logger.warning("웹소켓 상태 불량 – 구독 실패: %s", stock_code)
-                return False
-
-            if not websocket_manager.is_connected:
-                logger.warning("웹소켓 연결되지 않음 – 구독 실패: %s", stock_code)
-                return False
-
-            if websocket_manager.is_subscribed(stock_code):
-                logger.debug("이미 구독된 종목: %s", stock_code)
-                return True
-
-            if not websocket_manager.has_subscription_capacity():
-                logger.warning("구독 한도 초과 – 구독 실패: %s", stock_code)
-                return False
-
-            # 이벤트 루프 확인
-            if not getattr(websocket_manager, '_event_loop', None) or websocket_manager._event_loop.is_closed():
-                logger.warning("이벤트 루프 없음/종료 – 구독 실패: %s", stock_code)
-                return False
-
-            try:
-                if websocket_manager.subscribe_stock_sync(stock_code):
-                    logger.info("📡 웹소켓 구독 추가 성공: %s", stock_code)
-                    return True
-                logger.warning("웹소켓 구독 실패: %s", stock_code)
-                return False
-            except Exception as e:
-                logger.error("웹소켓 구독 오류 %s: %s", stock_code, e)
-                return False
+            event_loop = websocket_manager._event_loop
+            logger.debug(
+                f"웹소켓 구독 실패 점검 {failed}: "
+                f"healthy={websocket_manager.is_websocket_healthy()}, "
+                f"connected={websocket_manager.is_connected}, "
+                f"event_loop={'OK' if event_loop and not event_loop.is_closed() else '없음/종료'}, "
+                f"capacity={websocket_manager.has_subscription_capacity()}"
+            )
         except Exception as e:
-            logger.error("웹소켓 구독 추가 오류 %s: %s", stock_code, e)
-            return False 
\ No newline at end of file
+            logger.debug(f"웹소켓 구독 실패 점검 오류: {e}")
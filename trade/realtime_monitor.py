@@ -5,9 +5,10 @@
 import time
 import asyncio
 import threading
-from typing import Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, TypeVar, TYPE_CHECKING
 from datetime import datetime, time as dt_time
-from collections import defaultdict, deque
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from models.stock import Stock, StockStatus
 from .stock_manager import StockManager
 from .trade_executor import TradeExecutor
@@ -15,7 +16,8 @@ from .order_recovery_manager import OrderRecoveryManager
 from .trading_condition_analyzer import TradingConditionAnalyzer
 from utils.korean_time import now_kst
 from utils.logger import setup_logger
-from utils import get_trading_config_loader
+from utils import get_trading_config_loader, is_info_enabled
+from utils.stock_data_loader import get_stock_data_loader
 # 🆕 Performance logging helper
 from trade.realtime.performance_logger import PerformanceLogger
 # 🆕 workers
@@ -23,17 +25,56 @@ from trade.realtime.scan_worker import IntradayScanWorker
 # 🆕 Subscription manager
 from trade.realtime.ws_subscription import SubscriptionManager
 from trade.realtime.market_clock import MarketClock
-from trade.realtime.realtime_provider import RealtimeProvider
 from trade.realtime.stats_tracker import StatsTracker
 from trade.realtime.buy_runner import BuyRunner
 from trade.realtime.sell_runner import SellRunner
+from trade.realtime.buy_processor import BuyProcessor
+from trade.realtime.sell_processor import SellProcessor
+from trade.realtime.monitor_core import MonitorCore
+from trade.realtime.maintenance import MaintenanceManager
 
 logger = setup_logger(__name__)
 
+T = TypeVar("T")
+
+# __str__ 출력 포맷 (모듈 로드 시 1회 정의)
+_STR_FMT = "RealTimeMonitor(모니터링: {m}, 주기: {i}초, 스캔횟수: {c}, 신호감지: 매수{b}/매도{s}, 웹소켓종목: {w}개)"
+
+# 포지션 현황 로그 항목 포맷 (상태값, 종목 수) – % 포맷으로 항목별 f-string/리스트 생성 생략
+_POSITION_ITEM_FMT = "%s: %d개"
+
+# 웹소켓 상태 요약 포맷 (연결+정상 / 연결만 / 미연결) – 인자: 구독 수, 총 메시지 수, 최근 수신 정보
+_WS_SUMMARY_HEALTHY_FMT = "🟢(%d개구독/총%d건/최근%s)"
+_WS_SUMMARY_UNHEALTHY_FMT = "🔴(%d개구독/총%d건/최근%s)"
+_WS_SUMMARY_DISCONNECTED_FMT = "⚪(%d개구독/총%d건/최근%s)"
+
 
 class RealTimeMonitor:
     """장시간 실시간 모니터링을 담당하는 클래스 (웹소켓 기반 최적화 버전)"""
     
+    # 🆕 인스턴스 속성 고정 (__dict__ 대신 슬롯 접근) – __init__ 에 속성 추가 시 여기에도 등록
+    __slots__ = (
+        # 협력 객체
+        'stock_manager', 'trade_executor', 'order_recovery_manager', 'condition_analyzer',
+        'performance_logger', 'scan_worker', 'sub_manager', 'buy_processor', 'sell_processor',
+        'core', 'clock', 'stats_tracker', 'maintenance', 'vol_monitor',
+        'buy_runner', 'sell_runner', 'websocket_manager', '_cycle_pool', '_cycle_workers',
+        # 설정
+        'config_loader', 'strategy_config', 'performance_config', 'daytrading_config',
+        'market_config', 'risk_config',
+        '_test_mode', '_test_mode_log_every', '_perf_log_secs', '_stuck_check_secs', '_status_report_secs',
+        'fast_monitoring_interval', 'normal_monitoring_interval', 'current_monitoring_interval',
+        'market_open_time', 'market_close_time', 'day_trading_exit_time', 'pre_close_time',
+        'market_volatility_threshold', 'high_volume_threshold', 'high_volatility_position_ratio',
+        'intraday_scan_interval', 'max_additional_stocks', 'duplicate_buy_cooldown',
+        # 상태 / 동기화
+        '_monitoring_lock', '_is_monitoring', '_stats_lock', '_shutdown_requested', '_cycle_lock',
+        '_force_sell_lock', '_status_cache', '_status_cache_ts', '_status_cache_ttl', '_status_lock',
+        '_cycle_now', '_cycle_market_phase',
+        'alert_sent', '_alert_lock', 'alert_ttl_seconds',
+        'last_intraday_scan_time', '_recent_buy_times', '_daily_report_logged',
+    )
+    
     def __init__(self, stock_manager: StockManager, trade_executor: TradeExecutor):
         """RealTimeMonitor 초기화
         
@@ -77,34 +118,46 @@ class RealTimeMonitor:
         self.market_config = self.config_loader.load_market_schedule_config()
         self.risk_config = self.config_loader.load_risk_management_config()
         
+        # 🆕 사이클마다 조회하던 정적 설정값 사전 계산 (MonitorCore 에서 사용)
+        self._test_mode = self.strategy_config.get('test_mode', True)
+        self._test_mode_log_every = self.strategy_config.get('test_mode_log_interval_cycles', 100)
+        self._perf_log_secs = self.strategy_config.get('performance_log_interval_minutes', 5) * 60
+        self._stuck_check_secs = self.strategy_config.get('stuck_order_check_interval_seconds', 30)
+        self._status_report_secs = self.strategy_config.get('status_report_interval_minutes', 1) * 60
+        
         # 🔥 설정 기반 모니터링 주기 (하드코딩 제거)
         self.fast_monitoring_interval = self.performance_config.get('fast_monitoring_interval', 3)
         self.normal_monitoring_interval = self.performance_config.get('normal_monitoring_interval', 10)
         self.current_monitoring_interval = self.fast_monitoring_interval
         
         # 모니터링 상태 (스레드 안전성 개선)
-        self._monitoring_lock = threading.RLock()  # 모니터링 상태 보호용
+        self._monitoring_lock = threading.Lock()  # 모니터링 상태 보호용 (재진입 불필요)
         self._is_monitoring = threading.Event()    # 스레드 안전한 플래그
-        self.monitor_thread = None
+        # 전용 모니터 스레드 없음 – TradeManager 의 asyncio 루프가 monitor_cycle_async 로 구동
         self.websocket_manager = None
         
-        # 🆕 원자적 통계 업데이트를 위한 락
-        self._stats_lock = threading.RLock()
-        
-        # 통계 (원자적 접근 보장)
-        self._market_scan_count = 0
-        self._buy_signals_detected = 0
-        self._sell_signals_detected = 0
-        self._buy_orders_executed = 0
-        self._sell_orders_executed = 0
-        self._last_scan_time = None
+        # 🆕 통계 재설정(StatsTracker 교체) 전용 락 – 카운터 증가/조회는 StatsTracker 에서 락 없이 처리
+        self._stats_lock = threading.Lock()
         
-        # 🆕 스레드 안전한 종료 플래그
+        # 🆕 스레드 안전한 종료 플래그 (stop_monitoring 에서 set → 진행 중 사이클 조기 종료)
         self._shutdown_requested = threading.Event()
         
         # 🆕 monitor_cycle 재진입 방지 락
         self._cycle_lock = threading.Lock()
         
+        # 🆕 사이클 단위 시각/시장단계 캐시 (사이클 진행 중에만 유효, 종료 시 None)
+        self._cycle_now: Optional[datetime] = None
+        self._cycle_market_phase: Optional[str] = None
+        
+        # 🆕 강제 매도 병렬 처리 시 체결 확인(TradeExecutor 상태 변경) 직렬화용 락
+        self._force_sell_lock = threading.Lock()
+        
+        # 🆕 get_monitoring_status 스냅샷 캐시 (짧은 TTL 로 연속 조회 병합)
+        self._status_cache: Optional[Dict] = None
+        self._status_cache_ts = 0.0
+        self._status_cache_ttl = self.performance_config.get('monitoring_status_cache_ttl', 1.0)  # 초
+        self._status_lock = threading.Lock()
+        
         # 🔥 설정 기반 시장 시간 (하드코딩 제거)
         self.market_open_time = dt_time(
             self.strategy_config.get('market_open_hour', 9), 
@@ -128,8 +181,13 @@ class RealTimeMonitor:
         self.high_volume_threshold = self.strategy_config.get('high_volume_threshold', 3.0)
         self.high_volatility_position_ratio = self.strategy_config.get('high_volatility_position_ratio', 0.3)
         
-        # 중복 알림 방지 (유지)
-        self.alert_sent = set()
+        # 중복 알림 방지 – {종목코드: 만료 monotonic 시각} (TTL 로 크기 제한)
+        self.alert_sent: Dict[str, float] = {}
+        self._alert_lock = threading.Lock()
+        self.alert_ttl_seconds = self.performance_config.get('alert_ttl_seconds', 3600)
+        
+        # 일일 리포트 기록 일자 (PerformanceLogger 가 갱신)
+        self._daily_report_logged: Optional[str] = None
         
         # 🔥 설정 기반 장중 추가 종목 스캔 (하드코딩 제거)
         self.last_intraday_scan_time = None
@@ -139,11 +197,9 @@ class RealTimeMonitor:
         # 🔥 웹소켓 구독 대기열은 SubscriptionManager 로 관리
         
         # 🆕 중복 매수 쿨다운 관리 (Expectancy 개선)
-        self._recent_buy_times: Dict[str, datetime] = {}
         self.duplicate_buy_cooldown = self.daytrading_config.get('duplicate_buy_cooldown_seconds', 10)
         
         # 🆕 BuyProcessor 초기화 (매수 조건/주문 위임)
-        from trade.realtime.buy_processor import BuyProcessor
         self.buy_processor = BuyProcessor(
             stock_manager=self.stock_manager,
             trade_executor=self.trade_executor,
@@ -153,11 +209,10 @@ class RealTimeMonitor:
             duplicate_buy_cooldown=self.duplicate_buy_cooldown,
         )
 
-        # RealTimeMonitor 와 최근 매수 시각 dict 공유 (기존 로직 호환)
-        self.buy_processor._recent_buy_times = self._recent_buy_times
+        # RealTimeMonitor 와 최근 매수 시각(monotonic) 기록 공유 (기존 로직 호환, 크기 제한은 BuyProcessor 가 관리)
+        self._recent_buy_times = self.buy_processor._recent_buy_times
         
         # 🆕 SellProcessor 초기화
-        from trade.realtime.sell_processor import SellProcessor
         self.sell_processor = SellProcessor(
             stock_manager=self.stock_manager,
             trade_executor=self.trade_executor,
@@ -169,24 +224,28 @@ class RealTimeMonitor:
         logger.info("RealTimeMonitor 초기화 완료 (웹소켓 기반 최적화 버전 + 장중추가스캔)")
 
         # 🆕 MonitorCore 생성 (legacy monitor_cycle 위임용)
-        from trade.realtime.monitor_core import MonitorCore
         self.core = MonitorCore(self)
 
         # 🆕 모듈화 컴포넌트 실제 초기화 (strategy_config 로딩 이후)
         self.clock = MarketClock(self.strategy_config)
-        self.rt_provider = RealtimeProvider(self.stock_manager)
         self.stats_tracker = StatsTracker()
 
-        # 유지보수 및 변동성 모듈 초기화
-        from trade.realtime.maintenance import MaintenanceManager
-        from trade.realtime.volatility_monitor import VolatilityMonitor
-
+        # 유지보수 모듈 초기화
         self.maintenance = MaintenanceManager(self)
-        self.vol_monitor = VolatilityMonitor(
-            stock_manager=self.stock_manager,
-            volatility_threshold=self.market_volatility_threshold,
-            high_volatility_position_ratio=self.high_volatility_position_ratio,
-        )
+
+        # 변동성 감지는 설정으로 활성화한 경우에만 생성 (기본 비활성 – 전 포지션 순회 비용)
+        self.vol_monitor = None
+        if self.strategy_config.get('enable_volatility_detection', False):
+            from trade.realtime.volatility_monitor import VolatilityMonitor
+            self.vol_monitor = VolatilityMonitor(
+                stock_manager=self.stock_manager,
+                volatility_threshold=self.market_volatility_threshold,
+                high_volatility_position_ratio=self.high_volatility_position_ratio,
+            )
+
+        # 🆕 종목별 매수/매도 분석 병렬 처리 풀 (첫 사용 시 생성, 1 이면 순차 처리)
+        self._cycle_workers = max(1, int(self.performance_config.get('cycle_workers', 4)))
+        self._cycle_pool: Optional[ThreadPoolExecutor] = None
 
         # 🆕 BuyRunner 초기화
         self.buy_runner = BuyRunner(self)
@@ -201,6 +260,8 @@ class RealTimeMonitor:
     def is_monitoring(self, value: bool):
         """모니터링 상태 설정"""
         if value:
+            # 재시작 시 이전 종료 요청 해제
+            self._shutdown_requested.clear()
             self._is_monitoring.set()
         else:
             self._is_monitoring.clear()
@@ -250,10 +311,12 @@ class RealTimeMonitor:
     @orders_executed.setter
     def orders_executed(self, value: int):
         """총 주문 체결 수 초기화용 (매수 실행 수만 설정, 매도는 0으로 리셋)"""
-        # 재설정: StatsTracker 초기화 후 buy 주문 카운터 지정
-        self.stats_tracker = StatsTracker()
-        if value > 0:
-            self.stats_tracker.inc_buy_order(value)
+        # 재설정: 새 StatsTracker 구성 후 한 번에 교체 (복합 재설정 경로만 락 사용)
+        with self._stats_lock:
+            tracker = StatsTracker()
+            if value > 0:
+                tracker.inc_buy_order(value)
+            self.stats_tracker = tracker
     
     @property
     def buy_orders_executed(self) -> int:
@@ -283,8 +346,8 @@ class RealTimeMonitor:
         Returns:
             시장 개장 여부
         """
-        # MarketClock 로 위임
-        return self.clock.is_market_open()
+        # MarketClock 로 위임 (사이클 진행 중이면 사이클 기준 시각 사용)
+        return self.clock.is_market_open(self._cycle_now)
     
     def is_trading_time(self) -> bool:
         """거래 가능 시간 확인 (데이트레이딩 시간 고려)
@@ -292,8 +355,8 @@ class RealTimeMonitor:
         Returns:
             거래 가능 여부
         """
-        # MarketClock 로 위임
-        return self.clock.is_trading_time()
+        # MarketClock 로 위임 (사이클 진행 중이면 사이클 기준 시각 사용)
+        return self.clock.is_trading_time(self._cycle_now)
     
     def get_market_phase(self) -> str:
         """현재 시장 단계 확인 (TradingConditionAnalyzer 위임)
@@ -301,9 +364,30 @@ class RealTimeMonitor:
         Returns:
             시장 단계 ('opening', 'active', 'lunch', 'pre_close', 'closing', 'closed')
         """
+        # 사이클 진행 중이면 사이클 시작 시 계산한 값 재사용
+        cycle_phase = self._cycle_market_phase
+        if cycle_phase is not None:
+            return cycle_phase
+        
         # TradingConditionAnalyzer의 get_market_phase 사용 (중복 제거)
         return self.condition_analyzer.get_market_phase()
     
+    def cycle_now(self) -> datetime:
+        """현재 사이클 기준 시각 (사이클 밖에서는 now_kst())"""
+        cycle_now = self._cycle_now
+        return cycle_now if cycle_now is not None else now_kst()
+    
+    def _begin_cycle(self):
+        """사이클 시작 시 기준 시각과 시장 단계를 1회 계산해 캐시"""
+        current_dt = now_kst()
+        self._cycle_now = current_dt
+        self._cycle_market_phase = self.condition_analyzer.get_market_phase(now=current_dt)
+    
+    def _end_cycle(self):
+        """사이클 캐시 해제"""
+        self._cycle_now = None
+        self._cycle_market_phase = None
+    
     def adjust_monitoring_frequency(self):
         """시장 상황에 따른 모니터링 주기 동적 조정"""
         market_phase = self.get_market_phase()
@@ -319,10 +403,9 @@ class RealTimeMonitor:
             # 일반 시간대
             target_interval = self.normal_monitoring_interval
         
-        # 시장 변동성에 따른 추가 조정
-        #high_volatility_detected = self._detect_high_volatility()
-        #if high_volatility_detected:
-        #    target_interval = min(target_interval, self.fast_monitoring_interval)
+        # 시장 변동성에 따른 추가 조정 (enable_volatility_detection 설정 시에만)
+        if self.vol_monitor is not None and self.vol_monitor.is_high_volatility():
+            target_interval = min(target_interval, self.fast_monitoring_interval)
         
         # 모니터링 주기 업데이트
         if self.current_monitoring_interval != target_interval:
@@ -333,48 +416,49 @@ class RealTimeMonitor:
     # Delegated helpers
     # ------------------------------------------------------------------
 
-    def _detect_high_volatility(self) -> bool:
-        """VolatilityMonitor 로 위임"""
-        return self.vol_monitor.is_high_volatility()
-    
-    def get_realtime_data(self, stock_code: str) -> Optional[Dict]:
-        """웹소켓 실시간 데이터 조회 (StockManager 기반)
+    def map_stocks(self, func: Callable[[Stock], T], stocks: List[Stock]) -> List[T]:
+        """종목별 독립 처리를 사이클 워커 풀에서 실행하고 입력 순서대로 결과 반환
         
-        Args:
-            stock_code: 종목코드
-            
-        Returns:
-            실시간 데이터 또는 None
+        주문 API 호출(I/O)과 분석이 종목 간에 겹치도록 병렬화한다.
+        cycle_workers 가 1 이거나 종목이 1개 이하이면 현재 스레드에서 순차 처리.
         """
-        # RealtimeProvider 로 위임
-        return self.rt_provider.get(stock_code)
+        if self._cycle_workers <= 1 or len(stocks) <= 1:
+            return [func(stock) for stock in stocks]
+        
+        # run_cycle 은 _cycle_lock 으로 직렬화되므로 지연 생성 경합 없음
+        pool = self._cycle_pool
+        if pool is None:
+            pool = self._cycle_pool = ThreadPoolExecutor(
+                max_workers=self._cycle_workers, thread_name_prefix="MonitorCycle"
+            )
+        return list(pool.map(func, stocks))
     
-    def analyze_buy_conditions(self, stock: Stock, realtime_data: Dict) -> bool:
-        """(Deprecated) 기존 API 호환용 래퍼 – BuyProcessor 로 위임"""
+    def analyze_buy_conditions(self, stock: Stock, realtime_data: Optional[Dict] = None) -> bool:
+        """(Deprecated) 기존 API 호환용 래퍼 – BuyProcessor 로 위임 (realtime_data 는 무시, stock 실시간 데이터 사용)"""
         market_phase = self.get_market_phase()
-        return self.buy_processor.analyze_buy_conditions(stock, realtime_data, market_phase)
+        return self.buy_processor.analyze_buy_conditions(stock, market_phase)
     
-    def analyze_sell_conditions(self, stock: Stock, realtime_data: Dict) -> Optional[str]:
-        """매도 조건 분석 (TradingConditionAnalyzer 위임)
+    def analyze_sell_conditions(self, stock: Stock, realtime_data: Optional[Dict] = None) -> Optional[str]:
+        """매도 조건 분석 (SellProcessor 위임)
         
         Args:
             stock: 주식 객체
-            realtime_data: 실시간 데이터
+            realtime_data: (호환용, 무시됨) stock.realtime_data 를 직접 사용
             
         Returns:
             매도 사유 또는 None
         """
-        # TradingConditionAnalyzer에 위임
+        # SellProcessor 에 위임
         market_phase = self.get_market_phase()
-        return self.condition_analyzer.analyze_sell_conditions(stock, realtime_data, market_phase)
+        return self.sell_processor.analyze_sell_conditions(stock, market_phase)
     
-    def process_buy_ready_stocks(self) -> Dict[str, int]:
-        """BuyRunner.run 위임"""
-        return self.buy_runner.run()
+    def process_buy_ready_stocks(self, positions_by_status: Optional[Dict[StockStatus, List[Stock]]] = None) -> Dict[str, int]:
+        """BuyRunner.run 위임 (positions_by_status: 사이클 스냅샷, 옵션)"""
+        return self.buy_runner.run(positions_by_status)
     
-    def process_sell_ready_stocks(self) -> Dict[str, int]:
-        """SellRunner.run 위임"""
-        return self.sell_runner.run()
+    def process_sell_ready_stocks(self, positions_by_status: Optional[Dict[StockStatus, List[Stock]]] = None) -> Dict[str, int]:
+        """SellRunner.run 위임 (positions_by_status: 사이클 스냅샷, 옵션)"""
+        return self.sell_runner.run(positions_by_status)
     
     def calculate_buy_quantity(self, stock: Stock) -> int:
         """매수량 계산 (TradingConditionAnalyzer 위임)
@@ -385,26 +469,25 @@ class RealTimeMonitor:
         Returns:
             매수량
         """
-        # TradingConditionAnalyzer에 위임
-        return self.condition_analyzer.calculate_buy_quantity(stock)
+        # TradingConditionAnalyzer에 위임 (사이클 중이면 사이클 시장 단계 재사용)
+        return self.condition_analyzer.calculate_buy_quantity(stock, self.get_market_phase())
     
     def _log_performance_metrics(self):
         """성능 지표 로깅 (웹소켓 기반)"""
+        # INFO 비활성 시 포지션 집계/문자열 생성 전체 생략
+        if not is_info_enabled():
+            return
         try:
             market_phase = self.get_market_phase()
-            positions = self.stock_manager.get_all_positions()
+            sm = self.stock_manager
             
-            # 포지션 상태별 집계
-            status_counts = defaultdict(int)
-            total_unrealized_pnl = 0
+            # 포지션 상태별 집계 (상태 인덱스 기반, Stock 객체 생성 없음)
+            status_counts = sm.get_status_counts()
             
-            for pos in positions:
-                status_counts[pos.status.value] += 1
-                if pos.status == StockStatus.BOUGHT:
-                    # 🔥 웹소켓 실시간 데이터 직접 활용
-                    current_price = pos.realtime_data.current_price
-                    unrealized_pnl = pos.calculate_unrealized_pnl(current_price)
-                    total_unrealized_pnl += unrealized_pnl
+            # 🔥 보유 종목 미실현 손익 벡터 계산: (현재가 - 매수가) * 수량
+            prices, buy_prices, quantities = sm.get_position_arrays(StockStatus.BOUGHT)
+            valid = (prices > 0) & ~np.isnan(buy_prices)
+            total_unrealized_pnl = float(((prices - buy_prices) * quantities)[valid].sum())
             
             logger.info(f"📊 성능 지표 ({market_phase}): "
                        f"스캔횟수: {self.stats_tracker.market_scan_count}, "
@@ -413,12 +496,53 @@ class RealTimeMonitor:
                        f"주문실행: {self.stats_tracker.orders_executed}, "
                        f"미실현손익: {total_unrealized_pnl:+,.0f}원")
             
-            logger.info(f"📈 포지션 현황: " + 
-                       ", ".join([f"{status}: {count}개" for status, count in status_counts.items()]))
+            logger.info("📈 포지션 현황: " +
+                       ", ".join(map(_POSITION_ITEM_FMT.__mod__, status_counts.items())))
                        
         except Exception as e:
             logger.error(f"성능 지표 로깅 오류: {e}")
     
+    def is_alert_active(self, stock_code: str, now: Optional[float] = None) -> bool:
+        """종목의 매수 알림이 아직 유효한지 확인 (만료 시 False)
+        
+        Args:
+            stock_code: 종목코드
+            now: 기준 monotonic 시각 (루프에서 1회 조회한 값 재사용, None이면 즉시 조회)
+        """
+        expiry = self.alert_sent.get(stock_code)
+        if expiry is None:
+            return False
+        return expiry > (now if now is not None else time.monotonic())
+    
+    def mark_alert(self, stock_code: str):
+        """종목 매수 알림 기록 (alert_ttl_seconds 후 자동 만료)"""
+        with self._alert_lock:
+            self.alert_sent[stock_code] = time.monotonic() + self.alert_ttl_seconds
+    
+    def clear_alert(self, stock_code: str):
+        """종목 매수 알림 해제"""
+        # 알림이 없는 종목(대부분)은 락 없이 바로 반환
+        if stock_code not in self.alert_sent:
+            return
+        with self._alert_lock:
+            self.alert_sent.pop(stock_code, None)
+    
+    def purge_expired_alerts(self) -> int:
+        """만료된 알림 일괄 제거
+        
+        Returns:
+            제거된 알림 수
+        """
+        # 기록된 알림이 없으면 락/순회 생략 (clear_alert 와 동일한 사전 확인)
+        if not self.alert_sent:
+            return 0
+        now = time.monotonic()
+        with self._alert_lock:
+            expired = [code for code, expiry in self.alert_sent.items() if expiry <= now]
+            for code in expired:
+                del self.alert_sent[code]
+        return len(expired)
+    
     def _check_stuck_orders(self):
         """MaintenanceManager 로 위임"""
         self.maintenance.check_stuck_orders()
@@ -430,42 +554,42 @@ class RealTimeMonitor:
     def _get_websocket_status_summary(self) -> str:
         """웹소켓 상태 요약 문자열 반환"""
         try:
-            from typing import Optional, TYPE_CHECKING
             if TYPE_CHECKING:
                 from websocket.kis_websocket_manager import KISWebSocketManager
 
-            websocket_manager: Optional["KISWebSocketManager"] = getattr(
-                self.stock_manager, 'websocket_manager', None
-            )
+            websocket_manager: Optional["KISWebSocketManager"] = self.stock_manager.websocket_manager
             if not websocket_manager:
                 return "미사용"
             
-            # 웹소켓 연결 상태
+            # 웹소켓 연결 상태 (미연결이면 건강성 조회 생략 – 포맷 선택에 쓰이지 않음)
             is_connected = websocket_manager.is_connected
-            is_healthy = websocket_manager.is_websocket_healthy()
+            is_healthy = is_connected and websocket_manager.is_websocket_healthy()
             
-            # 구독 정보
-            subscribed_count = len(websocket_manager.get_subscribed_stocks())
+            # 구독 정보 (목록 복사 없이 개수만 조회)
+            subscribed_count = websocket_manager.get_subscription_count()
             
             # 메시지 통계
             message_stats = websocket_manager.message_handler.stats
             total_messages = message_stats.get('messages_received', 0)
-            last_message_time = message_stats.get('last_message_time')
+            last_message_monotonic = message_stats.get('last_message_monotonic')
             
-            # 마지막 메시지 수신 시간 계산
-            if last_message_time:
-                time_since_last = (now_kst() - last_message_time).total_seconds()
+            # 마지막 메시지 수신 경과 시간 (monotonic 차이 – datetime 연산 없음)
+            if last_message_monotonic is not None:
+                time_since_last = time.monotonic() - last_message_monotonic
                 if time_since_last < 60:
-                    last_msg_info = f"{time_since_last:.0f}초전"
+                    last_msg_info = "%.0f초전" % time_since_last
                 else:
-                    last_msg_info = f"{time_since_last/60:.1f}분전"
+                    last_msg_info = "%.1f분전" % (time_since_last / 60)
             else:
                 last_msg_info = "없음"
             
-            # 연결 상태 아이콘
-            status_icon = "🟢" if is_connected and is_healthy else "🔴" if is_connected else "⚪"
+            # 연결 상태별 포맷 선택
+            if is_connected:
+                fmt = _WS_SUMMARY_HEALTHY_FMT if is_healthy else _WS_SUMMARY_UNHEALTHY_FMT
+            else:
+                fmt = _WS_SUMMARY_DISCONNECTED_FMT
             
-            return f"{status_icon}({subscribed_count}개구독/총{total_messages}건/최근{last_msg_info})"
+            return fmt % (subscribed_count, total_messages, last_msg_info)
             
         except Exception as e:
             logger.debug(f"웹소켓 상태 요약 오류: {e}")
@@ -484,8 +608,17 @@ class RealTimeMonitor:
         """모니터링 중지"""
         self._is_monitoring.clear()
         
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=5)
+        # 🔥 종료 이벤트 set → 실행 중인 monitor_cycle 이 다음 단계 진입 전 즉시 빠져나옴
+        #    (전용 스레드가 없으므로 join 대기 없이 바로 반환)
+        self._shutdown_requested.set()
+        
+        # 장중 스캔 워커 스레드 정리
+        self.scan_worker.shutdown()
+        
+        # 사이클 워커 풀 정리 (진행 중 작업은 완료 후 스레드 종료)
+        if self._cycle_pool is not None:
+            self._cycle_pool.shutdown(wait=False)
+            self._cycle_pool = None
         
         # 최종 성능 지표 출력
         self._log_final_performance()
@@ -497,23 +630,46 @@ class RealTimeMonitor:
         self.performance_logger.log_final_performance()
     
     def get_monitoring_status(self) -> Dict:
-        """모니터링 상태 정보 반환 (웹소켓 기반 최적화)"""
-        # OrderRecoveryManager 통계 포함
-        recovery_stats = self.order_recovery_manager.get_recovery_statistics()
+        """모니터링 상태 정보 반환 (웹소켓 기반 최적화)
         
+        대시보드/웹소켓 푸시 등 연속 조회를 병합하기 위해 짧은 TTL(기본 1초,
+        performance_config 'monitoring_status_cache_ttl') 동안 마지막 스냅샷을 재사용합니다.
+        (카운터는 단조 증가이므로 약간의 지연 허용 – 지연 없는 값은 stats_tracker 속성을 직접 조회)
+        """
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and now - self._status_cache_ts < self._status_cache_ttl:
+            return cached
+        
+        with self._status_lock:
+            # 락 대기 중 다른 스레드가 갱신했으면 그대로 사용
+            if self._status_cache is not None and time.monotonic() - self._status_cache_ts < self._status_cache_ttl:
+                return self._status_cache
+            
+            status = self._build_monitoring_status()
+            self._status_cache = status
+            self._status_cache_ts = time.monotonic()
+            return status
+    
+    def _build_monitoring_status(self) -> Dict:
+        """모니터링 상태 딕셔너리 생성 (get_monitoring_status 캐시 미스 시 호출)"""
+        st = self.stats_tracker
+        
+        # hot path — 단일 dict 리터럴 유지 (.update() 등으로 재구성하지 말 것)
         return {
             'is_monitoring': self._is_monitoring.is_set(),
             'is_market_open': self.is_market_open(),
             'is_trading_time': self.is_trading_time(),
             'market_phase': self.get_market_phase(),
             'monitoring_interval': self.current_monitoring_interval,
-            'market_scan_count': self.stats_tracker.market_scan_count,
-            'buy_signals_detected': self.stats_tracker.buy_signals_detected,
-            'sell_signals_detected': self.stats_tracker.sell_signals_detected,
-            'orders_executed': self.stats_tracker.orders_executed,
-            'websocket_stocks': len(self.stock_manager.realtime_data),  # 웹소켓 관리 종목 수
+            'market_scan_count': st.market_scan_count,
+            'buy_signals_detected': st.buy_signals_detected,
+            'sell_signals_detected': st.sell_signals_detected,
+            'orders_executed': st.orders_executed,
+            'websocket_stocks': self.stock_manager.realtime_count,  # 웹소켓 관리 종목 수
             'alerts_sent': len(self.alert_sent),
-            'order_recovery_stats': recovery_stats  # 🆕 주문 복구 통계 추가
+            # 🆕 주문 복구 통계 (기존 API 호환을 위해 중첩 구조 유지)
+            'order_recovery_stats': self.order_recovery_manager.get_recovery_statistics()
         }
     
     def force_sell_all_positions(self) -> int:
@@ -524,39 +680,91 @@ class RealTimeMonitor:
         """
         logger.info("🚨 모든 포지션 강제 매도 시작")
         
-        sold_count = 0
         holding_stocks = self.stock_manager.get_stocks_by_status(StockStatus.BOUGHT)
+        if not holding_stocks:
+            logger.info("강제 매도 완료: 0개 포지션")
+            return 0
+        
+        # 🔥 보유 종목 실시간 가격을 한 번의 락 획득으로 일괄 조회
+        price_snapshot = self.stock_manager.snapshot_realtime(
+            [stock.stock_code for stock in holding_stocks]
+        )
         
-        for stock in holding_stocks:
-            try:
-                # 🔥 웹소켓 실시간 데이터 활용
-                realtime_data = self.get_realtime_data(stock.stock_code)
-                current_price = realtime_data['current_price'] if realtime_data else stock.close_price
-                
-                success = self.trade_executor.execute_sell_order(
-                    stock=stock,
-                    price=current_price,
-                    reason="force_close"
-                )
-                
-                if success:
-                    self.trade_executor.confirm_sell_execution(stock, current_price)
-                    sold_count += 1
-                    logger.info(f"강제 매도: {stock.stock_code}")
-                    
-            except Exception as e:
-                logger.error(f"강제 매도 실패 {stock.stock_code}: {e}")
+        # 🔥 종목별 매도 주문은 서로 독립적인 I/O 이므로 병렬 처리 (최대 16개 스레드)
+        with ThreadPoolExecutor(max_workers=min(len(holding_stocks), 16),
+                                thread_name_prefix="force-sell") as executor:
+            futures = {
+                executor.submit(self._force_sell_one, stock, price_snapshot.get(stock.stock_code)): stock
+                for stock in holding_stocks
+            }
+            sold_count = sum(1 for future in as_completed(futures) if future.result())
         
         logger.info(f"강제 매도 완료: {sold_count}개 포지션")
         return sold_count
     
+    def _force_sell_one(self, stock: Stock, realtime_data: Optional[Dict] = None) -> bool:
+        """단일 종목 강제 매도 (force_sell_all_positions 워커)
+        
+        Args:
+            stock: 매도할 종목
+            realtime_data: 미리 조회한 실시간 가격 스냅샷 (없으면 현재가 API → 전일 종가 순으로 대체)
+            
+        Returns:
+            매도 처리 성공 여부
+        """
+        try:
+            # 🔥 웹소켓 실시간 데이터 활용 (일괄 스냅샷)
+            current_price = realtime_data['current_price'] if realtime_data else 0
+            if not current_price or current_price <= 0:
+                # 실시간 가격이 없으면 (장중 추가 직후 등) 워커 스레드에서 현재가 조회 – 종목 간 병렬 진행
+                current_price = self._quote_current_price(stock.stock_code) or stock.close_price
+            
+            success = self.trade_executor.execute_sell_order(
+                stock=stock,
+                price=current_price,
+                reason="force_close"
+            )
+            
+            if not success:
+                return False
+            
+            # TradeExecutor 내부 통계/상태 변경은 한 번에 하나씩만 수행
+            with self._force_sell_lock:
+                self.trade_executor.confirm_sell_execution(stock, current_price)
+            
+            # INFO 비활성 시 메시지 포맷팅 생략 (loguru 지연 포맷 사용)
+            if is_info_enabled():
+                logger.info("강제 매도: {}", stock.stock_code)
+            return True
+            
+        except Exception as e:
+            logger.error(f"강제 매도 실패 {stock.stock_code}: {e}")
+            return False
+    
+    @staticmethod
+    def _quote_current_price(stock_code: str) -> float:
+        """KIS 현재가 조회 (강제 매도 가격 대체용, 실패 시 0)"""
+        try:
+            from api.kis_market_api import get_inquire_price_cached
+            price_data = get_inquire_price_cached(div_code="J", itm_no=stock_code)
+            if price_data is None or price_data.empty:
+                return 0.0
+            return float(price_data.iloc[0].get('stck_prpr', 0) or 0)
+        except Exception as e:
+            logger.debug(f"강제 매도 현재가 조회 실패 {stock_code}: {e}")
+            return 0.0
+    
     def __str__(self) -> str:
         """문자열 표현"""
-        return (f"RealTimeMonitor(모니터링: {self._is_monitoring.is_set()}, "
-                f"주기: {self.current_monitoring_interval}초, "
-                f"스캔횟수: {self.stats_tracker.market_scan_count}, "
-                f"신호감지: 매수{self.stats_tracker.buy_signals_detected}/매도{self.stats_tracker.sell_signals_detected}, "
-                f"웹소켓종목: {len(self.stock_manager.realtime_data)}개)")
+        st = self.stats_tracker
+        return _STR_FMT.format(
+            m=self._is_monitoring.is_set(),
+            i=self.current_monitoring_interval,
+            c=st.market_scan_count,
+            b=st.buy_signals_detected,
+            s=st.sell_signals_detected,
+            w=self.stock_manager.realtime_count,
+        )
     
     def get_sell_condition_analysis(self) -> Dict:
         """매도 조건 분석 성과 조회 (TradingConditionAnalyzer 위임)
@@ -585,7 +793,6 @@ class RealTimeMonitor:
         """StockManager.add_intraday_stock 래퍼. 웹소켓 구독 대기열 관리 유지"""
         try:
             if not stock_name:
-                from utils.stock_data_loader import get_stock_data_loader
                 stock_name = get_stock_data_loader().get_stock_name(stock_code)
 
             # 기본 시장 데이터 없이 바로 추가 (세부 데이터는 StockManager 내부에서 보완)
@@ -611,6 +818,21 @@ class RealTimeMonitor:
     def monitor_cycle(self):
         """MonitorCore.run_cycle 에 위임 (호환용)"""
         return self.core.run_cycle()
+    
+    async def monitor_cycle_async(self):
+        """이벤트 루프에서 호출하는 모니터링 사이클
+        
+        KIS REST 호출이 동기 방식이므로 사이클 본체는 기본 executor 에서 실행하고,
+        스케줄링/타임아웃/취소는 호출한 이벤트 루프(TradeManager 메인 루프)가 담당한다.
+        """
+        # 이전 사이클(타임아웃 후에도 executor 에서 계속 실행 중일 수 있음)이 끝나지 않았으면
+        # executor 스레드를 점유하지 않고 바로 건너뜀 (run_cycle 내부 non-blocking 획득과 동일 판단)
+        if self._cycle_lock.locked():
+            logger.debug("⚠️ 이전 monitor_cycle() 아직 실행 중 - 이번 사이클 건너뜀")
+            return None
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.core.run_cycle)
 
     def _analyze_fast_buy_conditions(self, stock: "Stock", realtime_data: Dict) -> bool:
         # 남겨둔 호환용 더미 – 호출 시 False 반환
@@ -7,12 +7,17 @@
 """
 from typing import Tuple
 
+import numpy as np
+
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 __all__ = ["analyze_orderbook"]
 
+# 호가 분석에 필요한 현재가 응답 필드 (1회 reindex 로 일괄 추출)
+_ORDERBOOK_FIELDS = ("askp1", "bidp1", "askp_rsqn1", "bidp_rsqn1")
+
 
 def analyze_orderbook(stock_code: str, max_spread_pct: float = 4.0) -> Tuple[float, str]:
     """주어진 종목의 호가 정보를 분석하여 (점수, 사유) 반환.
@@ -23,17 +28,18 @@ def analyze_orderbook(stock_code: str, max_spread_pct: float = 4.0) -> Tuple[flo
         score (float), reason (str)
     """
     try:
-        from api.kis_market_api import get_inquire_price
+        from api.kis_market_api import get_inquire_price_cached
 
-        price_data = get_inquire_price(div_code="J", itm_no=stock_code)
+        price_data = get_inquire_price_cached(div_code="J", itm_no=stock_code)
         if price_data is None or price_data.empty:
             return 0.0, ""
 
-        row = price_data.iloc[0]
+        # 필드별 row.get + float 변환 대신 1회 reindex → float64 배열
+        best_ask, best_bid, ask_qty, bid_qty = (
+            price_data.iloc[0].reindex(_ORDERBOOK_FIELDS, fill_value=0).to_numpy(dtype=np.float64).tolist()
+        )
 
         # 스프레드 계산
-        best_ask = float(row.get("askp1", 0))
-        best_bid = float(row.get("bidp1", 0))
         if best_ask <= 0 or best_bid <= 0:
             spread_score = 0
             spread_reason = ""
@@ -53,8 +59,6 @@ def analyze_orderbook(stock_code: str, max_spread_pct: float = 4.0) -> Tuple[flo
                 return 0.0, f"고스프레드({spread_pct:.2f}%)"
 
         # 잔량 비율 계산
-        ask_qty = float(row.get("askp_rsqn1", 0))
-        bid_qty = float(row.get("bidp_rsqn1", 0))
         if ask_qty > 0 and bid_qty > 0:
             bid_ask_ratio = bid_qty / (ask_qty + bid_qty)
             if bid_ask_ratio >= 0.55:
@@ -8,7 +8,7 @@ TradingConditionAnalyzer에서 분리하여 매도 조건 분석만을 담당하
 
 from typing import Dict, Optional
 from datetime import datetime
-from models.stock import Stock
+from models.stock import Stock, RealtimeData
 from utils.korean_time import now_kst
 from utils.logger import setup_logger
 
@@ -19,7 +19,7 @@ class SellConditionAnalyzer:
     """매도 조건 분석 전담 클래스 (Static 메서드 기반)"""
     
     @staticmethod
-    def analyze_sell_conditions(stock: Stock, realtime_data: Dict, market_phase: str,
+    def analyze_sell_conditions(stock: Stock, realtime_data: RealtimeData, market_phase: str,
                                strategy_config: Dict, risk_config: Dict, performance_config: Dict) -> Optional[str]:
         """매도 조건 분석 (우선순위 기반 개선 버전)
         
@@ -36,8 +36,8 @@ class SellConditionAnalyzer:
         """
         try:
             # 🆕 가격 보정: 현재가 vs 매도1호가 중 더 높은 값 사용
-            ask_price = realtime_data.get('ask_price') or realtime_data.get('ask_price1') or 0
-            current_price = realtime_data.get('current_price', stock.close_price)
+            ask_price = realtime_data.ask_price or 0
+            current_price = realtime_data.current_price
             current_price = max(current_price, ask_price)
             
             # 현재 손익 상황 계산
@@ -137,7 +137,7 @@ class SellConditionAnalyzer:
             return None
     
     @staticmethod
-    def _check_immediate_sell_conditions(stock: Stock, realtime_data: Dict, market_phase: str,
+    def _check_immediate_sell_conditions(stock: Stock, realtime_data: RealtimeData, market_phase: str,
                                         current_pnl_rate: float, trading_halt: bool, 
                                         volatility: float, strategy_config: Dict) -> Optional[str]:
         """즉시 매도 조건 확인"""
@@ -157,7 +157,7 @@ class SellConditionAnalyzer:
         # 상한가 직전(+29%) 도달 시 즉시 익절 매도
         try:
             limit_up_rate = strategy_config.get('limit_up_profit_rate', 29.0)
-            current_price = realtime_data.get('current_price', stock.close_price)
+            current_price = realtime_data.current_price
             yesterday_close = getattr(stock.reference_data, 'yesterday_close', 0)
 
             if yesterday_close > 0 and current_price > 0:
@@ -176,7 +176,7 @@ class SellConditionAnalyzer:
         return None
     
     @staticmethod
-    def _check_stop_loss_conditions(stock: Stock, realtime_data: Dict, current_price: float,
+    def _check_stop_loss_conditions(stock: Stock, realtime_data: RealtimeData, current_price: float,
                                    current_pnl_rate: float, holding_minutes: float,
                                    strategy_config: Dict, risk_config: Dict) -> Optional[str]:
         """손절 조건 확인"""
@@ -246,7 +246,7 @@ class SellConditionAnalyzer:
         return None
     
     @staticmethod
-    def _check_technical_sell_conditions(stock: Stock, realtime_data: Dict, current_pnl_rate: float,
+    def _check_technical_sell_conditions(stock: Stock, realtime_data: RealtimeData, current_pnl_rate: float,
                                         holding_minutes: float, market_phase: str, 
                                         contract_strength: float, buy_ratio: float,
                                         market_pressure: str, strategy_config: Dict, performance_config: Dict) -> Optional[str]:
@@ -332,11 +332,11 @@ class SellConditionAnalyzer:
         return base_stop_loss * multiplier * 100
     
     @staticmethod
-    def _analyze_rapid_decline_sell_signal(stock: Stock, realtime_data: Dict, current_pnl_rate: float,
+    def _analyze_rapid_decline_sell_signal(stock: Stock, realtime_data: RealtimeData, current_pnl_rate: float,
                                           strategy_config: Dict) -> Optional[str]:
         """가격 급락 보호 매도 신호 분석 (간단한 버전)"""
         try:
-            current_price = realtime_data.get('current_price', stock.close_price)
+            current_price = realtime_data.current_price
             buy_price = stock.buy_price or current_price
             
             # 매수가 대비 급락 체크
@@ -348,7 +348,7 @@ class SellConditionAnalyzer:
                     return "rapid_decline_from_buy"
             
             # 단기 변동성 급증 체크
-            price_change_rate = realtime_data.get('price_change_rate', 0) / 100
+            price_change_rate = realtime_data.price_change_rate / 100
             if price_change_rate <= -0.015:  # 1.5% 이상 하락
                 volatility = getattr(stock.realtime_data, 'volatility', 0.0)
                 high_volatility_for_decline = strategy_config.get('high_volatility_for_decline', 4.0)
@@ -363,7 +363,7 @@ class SellConditionAnalyzer:
             return None
     
     @staticmethod
-    def _check_orderbook_sell_conditions(stock: Stock, realtime_data: Dict, 
+    def _check_orderbook_sell_conditions(stock: Stock, realtime_data: RealtimeData, 
                                        current_pnl_rate: float, holding_minutes: float, strategy_config: Dict) -> Optional[str]:
         """호가잔량 기반 매도 조건 확인 (신규 추가)"""
         try:
@@ -400,8 +400,8 @@ class SellConditionAnalyzer:
                     return "low_bid_interest"
             
             # 3. 호가 스프레드 급확대 (유동성 부족)
-            bid_price = realtime_data.get('bid_price', 0) or getattr(stock.realtime_data, 'bid_price', 0)
-            ask_price = realtime_data.get('ask_price', 0) or getattr(stock.realtime_data, 'ask_price', 0)
+            bid_price = realtime_data.bid_price
+            ask_price = realtime_data.ask_price
             
             if bid_price > 0 and ask_price > 0:
                 spread_rate = (ask_price - bid_price) / bid_price
@@ -418,7 +418,7 @@ class SellConditionAnalyzer:
             return None
     
     @staticmethod
-    def _check_volume_pattern_sell_conditions(stock: Stock, realtime_data: Dict,
+    def _check_volume_pattern_sell_conditions(stock: Stock, realtime_data: RealtimeData,
                                             holding_minutes: float, strategy_config: Dict) -> Optional[str]:
         """거래량 패턴 기반 매도 조건 확인 (신규 추가)"""
         try:
@@ -461,7 +461,7 @@ class SellConditionAnalyzer:
             return None
     
     @staticmethod
-    def _check_enhanced_contract_sell_conditions(stock: Stock, realtime_data: Dict,
+    def _check_enhanced_contract_sell_conditions(stock: Stock, realtime_data: RealtimeData,
                                                current_pnl_rate: float, holding_minutes: float, 
                                                strategy_config: Dict) -> Optional[str]:
         """강화된 체결 불균형 매도 조건 확인 (신규 추가)"""
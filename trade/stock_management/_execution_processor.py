@@ -301,7 +301,8 @@ class _ExecutionProcessor:
                     logger.error(f"❌ 매수 체결 DB 저장 오류 {stock_code}: {db_e}")
 
                 if self._realtime_monitor_ref and remaining_qty == 0:
-                    self._realtime_monitor_ref.buy_orders_executed += 1
+                    # 속성 get/set(카운터 합산 2회 + 차분 계산) 대신 StatsTracker 카운터 직접 증가
+                    self._realtime_monitor_ref.stats_tracker.inc_buy_order()
 
                 logger.info(
                     f"✅ 매수 체결 처리: {stock_code} {exec_qty}주 @{exec_price:,}원 (누적 {filled_new}/{ordered_qty}주, 잔량 {remaining_qty})")
@@ -394,7 +395,8 @@ class _ExecutionProcessor:
                     logger.error(f"❌ 매도 체결 DB 저장 오류 {stock_code}: {db_e}")
 
                 if self._realtime_monitor_ref and remaining_qty == 0:
-                    self._realtime_monitor_ref.sell_orders_executed += 1
+                    # 속성 get/set(카운터 합산 2회 + 차분 계산) 대신 StatsTracker 카운터 직접 증가
+                    self._realtime_monitor_ref.stats_tracker.inc_sell_order()
 
                 logger.info(
                     f"✅ 매도 체결 처리: {stock_code} {exec_qty}주 @{exec_price:,}원 (누적 {filled_new}/{ordered_qty}주, 잔량 {remaining_qty})")
@@ -13,8 +13,10 @@
 - 스레드 안전한 상태 관리
 - 락 순서 일관성 보장
 - 배치 조회로 락 경합 최소화
+- 상태별 종목코드 인덱스로 전체 스캔 없이 상태 조회
 """
 
+import sys
 import threading
 from typing import Dict, List, Optional, Callable, TYPE_CHECKING
 from datetime import datetime
@@ -74,6 +76,16 @@ class _StockLifecycleManager:
         self.reference_stocks = reference_stocks
         self.realtime_data = realtime_data
         self.trading_status = trading_status
+        
+        # 🆕 상태별 종목코드 인덱스 {상태: {종목코드: None}} (삽입 순서 유지, _status_lock 하에서 갱신)
+        self._codes_by_status: Dict[StockStatus, Dict[str, None]] = {}
+        for code, status in trading_status.items():
+            self._codes_by_status.setdefault(status, {})[code] = None
+        
+        # 🆕 실시간 데이터 종목 수 (상태 조회 시 락 없이 읽기용, _realtime_lock 하에서 갱신)
+        self.realtime_count = len(realtime_data)
+        # 🆕 관리 종목 수 (Stock 객체 목록 생성 없이 조회용, _ref_lock 하에서 갱신)
+        self.position_count = len(stock_metadata)
         self.trade_info = trade_info
         
         # 락
@@ -92,6 +104,25 @@ class _StockLifecycleManager:
         
         logger.info("✅ StockLifecycleManager 초기화 완료")
     
+    def _set_status_locked(self, stock_code: str, new_status: Optional[StockStatus]):
+        """거래 상태 변경 + 상태 인덱스 갱신 (호출자가 _status_lock 보유)
+        
+        Args:
+            stock_code: 종목코드
+            new_status: 새 상태 (None 이면 제거)
+        """
+        old_status = self.trading_status.get(stock_code)
+        if old_status is not None:
+            codes = self._codes_by_status.get(old_status)
+            if codes is not None:
+                codes.pop(stock_code, None)
+        
+        if new_status is None:
+            self.trading_status.pop(stock_code, None)
+        else:
+            self.trading_status[stock_code] = new_status
+            self._codes_by_status.setdefault(new_status, {})[stock_code] = None
+    
     def add_selected_stock(self, stock_code: str, stock_name: str, 
                           open_price: float, high_price: float, 
                           low_price: float, close_price: float, 
@@ -108,6 +139,9 @@ class _StockLifecycleManager:
             return False
         
         try:
+            # 🆕 종목코드 intern – 이후 dict 조회 시 해시/문자열 비교 비용 절감
+            stock_code = sys.intern(stock_code)
+            
             # 1. 기본 메타데이터 저장
             with self._ref_lock:
                 self.stock_metadata[stock_code] = {
@@ -133,6 +167,7 @@ class _StockLifecycleManager:
                     )
                 
                 self.reference_stocks[stock_code] = ref_data
+                self.position_count = len(self.stock_metadata)
             
             # 3. 실시간 데이터 초기화
             with self._realtime_lock:
@@ -142,10 +177,11 @@ class _StockLifecycleManager:
                     today_high=high_price,
                     today_low=low_price
                 )
+                self.realtime_count = len(self.realtime_data)
             
             # 4. 거래 상태 초기화
             with self._status_lock:
-                self.trading_status[stock_code] = StockStatus.WATCHING
+                self._set_status_locked(stock_code, StockStatus.WATCHING)
                 self.trade_info[stock_code] = {
                     'buy_price': None,
                     'buy_quantity': None,
@@ -198,6 +234,8 @@ class _StockLifecycleManager:
                     stock_name = self.stock_metadata[stock_code].get('stock_name', 'Unknown')
                     del self.stock_metadata[stock_code]
                 
+                self.position_count = len(self.stock_metadata)
+                
                 if stock_code in self.reference_stocks:
                     del self.reference_stocks[stock_code]
                 else:
@@ -206,10 +244,11 @@ class _StockLifecycleManager:
             # 2. 실시간 데이터 제거
             with self._realtime_lock:
                 self.realtime_data.pop(stock_code, None)
+                self.realtime_count = len(self.realtime_data)
             
             # 3. 거래 상태 제거
             with self._status_lock:
-                self.trading_status.pop(stock_code, None)
+                self._set_status_locked(stock_code, None)
                 self.trade_info.pop(stock_code, None)
             
             # 4. 캐시 제거
@@ -239,6 +278,9 @@ class _StockLifecycleManager:
             추가 성공 여부
         """
         try:
+            # 🆕 종목코드 intern – 이후 dict 조회 시 해시/문자열 비교 비용 절감
+            stock_code = sys.intern(stock_code)
+            
             # 1. 중복 확인
             if stock_code in self.reference_stocks:
                 logger.warning(f"이미 관리 중인 종목입니다: {stock_code}[{stock_name}] - 장중 추가 생략")
@@ -295,6 +337,7 @@ class _StockLifecycleManager:
                 )
                 
                 self.reference_stocks[stock_code] = ref_data
+                self.position_count = len(self.stock_metadata)
             
             # 6. 실시간 데이터 초기화
             with self._realtime_lock:
@@ -310,10 +353,11 @@ class _StockLifecycleManager:
                     volume_spike_ratio=market_data.get('volume_spike_ratio', 1.0),
                     price_change_rate=market_data.get('price_change_rate', 0.0)
                 )
+                self.realtime_count = len(self.realtime_data)
             
             # 7. 거래 상태 초기화 (WATCHING 상태로 시작)
             with self._status_lock:
-                self.trading_status[stock_code] = StockStatus.WATCHING
+                self._set_status_locked(stock_code, StockStatus.WATCHING)
                 self.trade_info[stock_code] = {
                     'buy_price': None,
                     'buy_quantity': None,
@@ -459,9 +503,9 @@ class _StockLifecycleManager:
     def get_stocks_by_status(self, status: StockStatus) -> List[Stock]:
         """특정 상태의 종목들 반환 (락 최적화 버전)"""
         try:
-            # 🔥 락 순서 일관성 보장: status → 배치 조회
+            # 🔥 락 순서 일관성 보장: status → 배치 조회 (상태 인덱스로 전체 스캔 생략)
             with self._status_lock:
-                matching_codes = [code for code, s in self.trading_status.items() if s == status]
+                matching_codes = list(self._codes_by_status.get(status, ()))
             
             # 빈 리스트면 조기 반환 (락 없이)
             if not matching_codes:
@@ -480,6 +524,25 @@ class _StockLifecycleManager:
             logger.error(f"상태별 종목 조회 오류 {status.value}: {e}")
             return []
     
+    def get_codes_by_status(self, status: StockStatus) -> List[str]:
+        """특정 상태의 종목코드 목록 반환 (Stock 객체 생성 없음)"""
+        with self._status_lock:
+            return list(self._codes_by_status.get(status, ()))
+    
+    def count_by_status(self, status: StockStatus) -> int:
+        """특정 상태의 종목 수 반환 (O(1), Stock 객체 생성 없음)"""
+        with self._status_lock:
+            return len(self._codes_by_status.get(status, ()))
+    
+    def get_status_counts(self) -> Dict[str, int]:
+        """상태별 종목 수 반환 (상태 인덱스 기반, 종목 수와 무관하게 상태 수만큼만 순회)
+        
+        Returns:
+            {상태값: 종목 수} (종목이 없는 상태는 제외)
+        """
+        with self._status_lock:
+            return {status.value: len(codes) for status, codes in self._codes_by_status.items() if codes}
+    
     def get_stocks_by_status_batch(self, statuses: List[StockStatus]) -> Dict[StockStatus, List[Stock]]:
         """여러 상태의 종목들을 배치로 조회 (락 경합 최소화)
         
@@ -492,14 +555,12 @@ class _StockLifecycleManager:
         result = {status: [] for status in statuses}
         
         try:
-            # 🔥 한 번의 락으로 모든 상태 조회
+            # 🔥 한 번의 락으로 모든 상태 조회 (상태 인덱스 사용)
             with self._status_lock:
-                status_mapping = {}
-                for code, stock_status in self.trading_status.items():
-                    if stock_status in statuses:
-                        if stock_status not in status_mapping:
-                            status_mapping[stock_status] = []
-                        status_mapping[stock_status].append(code)
+                status_mapping = {
+                    status: list(self._codes_by_status.get(status, ()))
+                    for status in result
+                }
             
             # 🔥 배치 조회로 락 경합 최소화
             for status, codes in status_mapping.items():
@@ -523,7 +584,7 @@ class _StockLifecycleManager:
                     return False
                 
                 old_status = self.trading_status[stock_code]
-                self.trading_status[stock_code] = new_status
+                self._set_status_locked(stock_code, new_status)
                 
                 # 거래 정보 업데이트
                 if stock_code in self.trade_info:
@@ -549,12 +610,15 @@ class _StockLifecycleManager:
             count = len(self.stock_metadata)
             self.stock_metadata.clear()
             self.reference_stocks.clear()
+            self.position_count = 0
         
         with self._realtime_lock:
             self.realtime_data.clear()
+            self.realtime_count = 0
         
         with self._status_lock:
             self.trading_status.clear()
+            self._codes_by_status.clear()
             self.trade_info.clear()
         
         # 캐시 전체 정리는 별도 메서드로 처리하지 않고 개별 무효화
@@ -16,7 +16,8 @@
 
 import threading
 import time
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 from models.stock import Stock, StockStatus, ReferenceData, RealtimeData
 from utils.korean_time import now_kst
@@ -86,9 +87,6 @@ class StockManager:
         self._realtime_lock = threading.RLock() # 2순위: 실시간 데이터용
         self._status_lock = threading.RLock()   # 3순위: 상태 변경용
         
-        # 🆕 원자적 연산을 위한 추가 락
-        self._stats_lock = threading.RLock()    # 통계 업데이트용
-        
         # === 6. 기본 컴포넌트 준비 ===
         # 🆕 스레드 안전한 플래그들 (threading.Event 사용)
         self._shutdown_event = threading.Event()
@@ -143,6 +141,8 @@ class StockManager:
         
         # === 6. 🔥 설정 파일 기반 기본 설정 (하드코딩 제거) ===
         self.candidate_stocks: List[str] = []
+        # 웹소켓 매니저 참조 (setup_websocket_callbacks 에서 설정, 호출부 getattr 가드 불필요)
+        self.websocket_manager = None
         # 종목 관리 설정은 performance_config에서 로드
         self.max_selected_stocks = self.performance_config.get('max_premarket_selected_stocks', 10)  # 장전 선정 종목 한도
         
@@ -165,6 +165,19 @@ class StockManager:
         
         logger.info("StockManager 초기화 완료 (하이브리드 방식, 4단계 모듈화 적용: 캐시/빌더/실시간/체결처리 분리, 성능 최적화)")
     
+    @property
+    def realtime_count(self) -> int:
+        """실시간 데이터 관리 종목 수 (락 없이 조회, LifecycleManager 유지 카운터)"""
+        return self._lifecycle_manager.realtime_count
+    
+    @property
+    def position_count(self) -> int:
+        """관리 중인 종목 수 (락 없이 조회, LifecycleManager 유지 카운터)
+        
+        len(get_all_positions()) 와 같은 값을 Stock 객체 목록 생성 없이 반환한다.
+        """
+        return self._lifecycle_manager.position_count
+    
     # === 종목 추가/제거 ===
     
     def add_selected_stock(self, stock_code: str, stock_name: str, 
@@ -309,6 +322,32 @@ class StockManager:
             logger.error(f"스냅샷 조회 오류 {stock_code}: {e}")
             return None
     
+    def snapshot_realtime(self, stock_codes: Iterable[str]) -> Dict[str, dict]:
+        """여러 종목의 실시간 가격 데이터를 한 번의 락 획득으로 일괄 조회
+        
+        Args:
+            stock_codes: 조회할 종목코드 목록
+            
+        Returns:
+            {종목코드: 실시간 가격 딕셔너리} (실시간 데이터가 없는 종목은 제외)
+        """
+        with self._realtime_lock:
+            realtime_data = self.realtime_data
+            return {
+                code: {
+                    'current_price': rt.current_price,
+                    'today_volume': rt.today_volume,
+                    'today_high': rt.today_high,
+                    'today_low': rt.today_low,
+                    'price_change_rate': rt.price_change_rate,
+                    'bid_price': rt.bid_price,
+                    'ask_price': rt.ask_price,
+                    'last_updated': rt.last_updated,
+                }
+                for code in stock_codes
+                if (rt := realtime_data.get(code)) is not None
+            }
+    
     def change_stock_status(self, stock_code: str, new_status: StockStatus, 
                            reason: str = "", **trade_updates) -> bool:
         """종목 상태 변경 (LifecycleManager에 위임)"""
@@ -346,6 +385,75 @@ class StockManager:
     def get_all_positions(self) -> List[Stock]:
         return self.get_all_selected_stocks()
     
+    def count_by_status(self, status: StockStatus) -> int:
+        """특정 상태의 종목 수 (LifecycleManager에 위임)"""
+        return self._lifecycle_manager.count_by_status(status)
+    
+    def get_status_counts(self) -> Dict[str, int]:
+        """상태별 종목 수 (LifecycleManager에 위임)"""
+        return self._lifecycle_manager.get_status_counts()
+    
+    def get_position_arrays(self, status: StockStatus = StockStatus.BOUGHT) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """특정 상태 종목들의 (현재가, 매수가, 수량) 배열을 반환 (손익 벡터 계산용)
+        
+        매수가/수량이 없는 종목은 NaN/0 으로 채워진다.
+        
+        Args:
+            status: 조회할 상태 (기본: BOUGHT)
+            
+        Returns:
+            (current_prices, buy_prices, quantities) float64 배열 튜플
+        """
+        codes = self._lifecycle_manager.get_codes_by_status(status)
+        count = len(codes)
+        prices = np.zeros(count, dtype=np.float64)
+        buy_prices = np.full(count, np.nan, dtype=np.float64)
+        quantities = np.zeros(count, dtype=np.float64)
+        
+        # 🔥 락 순서 일관성 보장: realtime → status
+        with self._realtime_lock:
+            with self._status_lock:
+                for i, code in enumerate(codes):
+                    realtime = self.realtime_data.get(code)
+                    if realtime is not None:
+                        prices[i] = realtime.current_price
+                    info = self.trade_info.get(code)
+                    if info:
+                        if info.get('buy_price') is not None:
+                            buy_prices[i] = info['buy_price']
+                        quantities[i] = info.get('buy_quantity') or 0
+        
+        return prices, buy_prices, quantities
+    
+    def get_price_reference_arrays(self, statuses: Iterable[StockStatus]) -> Tuple[np.ndarray, np.ndarray]:
+        """지정 상태 종목들의 (현재가, 전일종가) 배열을 반환 (변동성 벡터 계산용)
+        
+        Args:
+            statuses: 조회할 상태 목록
+            
+        Returns:
+            (current_prices, yesterday_closes) float64 배열 튜플 – 데이터 없는 항목은 0
+        """
+        codes: List[str] = []
+        for status in statuses:
+            codes.extend(self._lifecycle_manager.get_codes_by_status(status))
+        count = len(codes)
+        prices = np.zeros(count, dtype=np.float64)
+        ref_prices = np.zeros(count, dtype=np.float64)
+        
+        # 🔥 락 순서 일관성 보장: ref → realtime
+        with self._ref_lock:
+            with self._realtime_lock:
+                for i, code in enumerate(codes):
+                    ref = self.reference_stocks.get(code)
+                    if ref is not None:
+                        ref_prices[i] = ref.yesterday_close
+                    realtime = self.realtime_data.get(code)
+                    if realtime is not None:
+                        prices[i] = realtime.current_price
+        
+        return prices, ref_prices
+    
     def get_all_stock_codes(self) -> List[str]:
         """현재 관리 중인 모든 종목 코드 반환 (LifecycleManager에 위임)"""
         return self._lifecycle_manager.get_all_stock_codes()
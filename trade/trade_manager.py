@@ -428,9 +428,7 @@ class TradeManager:
                     try:
                         # 🔥 타임아웃을 추가하여 매매 루프가 무한 대기하지 않도록 보호
                         await asyncio.wait_for(
-                            asyncio.get_event_loop().run_in_executor(
-                                None, self.realtime_monitor.monitor_cycle
-                            ),
+                            self.realtime_monitor.monitor_cycle_async(),
                             timeout=30.0  # 30초 타임아웃
                         )
                         logger.debug("✅ monitor_cycle() 실행 완료")
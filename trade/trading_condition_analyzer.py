@@ -9,15 +9,27 @@
 - 시장 단계별 조건 조정
 """
 
+import time
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-from models.stock import Stock, StockStatus
+from models.stock import Stock, StockStatus, RealtimeData
 from utils.korean_time import now_kst
-from utils.logger import setup_logger
+from utils.logger import setup_logger, is_debug_enabled
 from utils import get_trading_config_loader
+from .buy_condition_analyzer import BuyConditionAnalyzer
+from .sell_condition_analyzer import SellConditionAnalyzer
 
 logger = setup_logger(__name__)
 
+# 시장 단계 경계 시각 (자정 기준 초)
+_PHASE_MARKET_OPEN = 9 * 3600              # 09:00
+_PHASE_OPENING_END = 9 * 3600 + 30 * 60    # 09:30
+_PHASE_MORNING_END = 12 * 3600             # 12:00
+_PHASE_LUNCH_END = 13 * 3600               # 13:00
+_PHASE_AFTERNOON_END = 14 * 3600 + 50 * 60 # 14:50
+_PHASE_PRE_CLOSE_END = 15 * 3600           # 15:00
+_PHASE_MARKET_CLOSE = 15 * 3600 + 30 * 60  # 15:30
+
 
 class TradingConditionAnalyzer:
     """매매 조건 분석 및 포지션 사이징 전담 클래스"""
@@ -38,62 +50,79 @@ class TradingConditionAnalyzer:
         self.performance_config = self.config_loader.load_performance_config()  # 🆕 성능 설정 추가
         self.risk_config = self.config_loader.load_risk_management_config()
         
+        # 🆕 기준 시각 미지정 get_market_phase 결과 캐시 (monotonic 계산 시각, 단계)
+        self._market_phase_cache: Tuple[float, Optional[str]] = (0.0, None)
+        
+        # 🆕 선행 매수 필터 임계값 사전 계산 (종목·사이클마다 설정 dict 조회 방지)
+        cfg = self.performance_config
+        self._pre_buy_thresholds: Tuple[float, float, float, float, float, float] = (
+            cfg.get('min_bid_ask_ratio_for_buy', 1.0),       # 1.2 → 1.0 완화
+            cfg.get('max_ask_bid_ratio_for_buy', 3.0),       # 2.5 → 3.0 완화
+            cfg.get('min_buy_ratio_for_buy', 30.0),          # 40.0 → 30.0 완화
+            cfg.get('min_contract_strength_for_buy', 100.0), # 110.0 → 100.0 완화
+            cfg.get('max_price_change_rate_for_buy', 20.0),  # 15.0 → 20.0 완화
+            cfg.get('min_liquidity_score_for_buy', 2.0),     # 3.0 → 2.0 완화
+        )
+        
         logger.info("TradingConditionAnalyzer 초기화 완료")
     
-    def get_market_phase(self) -> str:
+    def get_market_phase(self, now: Optional[datetime] = None) -> str:
         """현재 시장 단계 확인 (정확한 시장 시간 기준: 09:00~15:30, 테스트 모드 고려)
         
+        Args:
+            now: 기준 시각 (None 이면 현재 KST 시각 기준, 1초 캐시 재사용)
+        
         Returns:
             시장 단계 ('opening', 'active', 'lunch', 'pre_close', 'closing', 'closed')
         """
-        from datetime import time as dt_time
+        if now is not None:
+            return self._compute_market_phase(now)
         
+        # 시장 단계는 분 단위로만 바뀌므로 기준 시각 미지정 호출은 1초 동안 결과 재사용
+        mono = time.monotonic()
+        cached_at, cached_phase = self._market_phase_cache
+        if cached_phase is not None and mono - cached_at < 1.0:
+            return cached_phase
+        
+        phase = self._compute_market_phase(now_kst())
+        self._market_phase_cache = (mono, phase)
+        return phase
+    
+    def _compute_market_phase(self, current_dt: datetime) -> str:
+        """기준 시각의 시장 단계 계산 (경계 시각은 자정 기준 초로 사전 계산된 값과 비교)"""
         # 🧪 테스트 모드에서는 시간과 관계없이 활성 거래 시간으로 처리
-        test_mode = self.strategy_config.get('test_mode', True)
-        if test_mode:
-            current_hour = now_kst().hour
+        if self.strategy_config.get('test_mode', True):
             # 테스트 모드에서도 시간대별로 다른 단계 반환 (더 현실적인 테스트)
-            if 9 <= current_hour < 10:
+            if 9 <= current_dt.hour < 10:
                 return 'opening'
-            elif 10 <= current_hour < 15:
-                return 'active'
-            else:
-                return 'active'  # 테스트 모드에서는 기본적으로 활성 시간
-        
-        current_time = now_kst().time()
-        current_weekday = now_kst().weekday()
+            return 'active'  # 테스트 모드에서는 기본적으로 활성 시간
         
         # 주말 체크 (토: 5, 일: 6)
-        if current_weekday >= 5:
+        if current_dt.weekday() >= 5:
             return 'closed'
         
-        # 🔥 정확한 시장 시간 기준 (09:00~15:30)
-        market_open = dt_time(9, 0)    # 09:00
-        market_close = dt_time(15, 30) # 15:30
+        sec = (current_dt.hour * 3600 + current_dt.minute * 60 + current_dt.second
+               + current_dt.microsecond / 1_000_000)
         
-        # 시장 마감 후
-        if current_time > market_close:
-            return 'closed'
-        
-        # 시장 개장 전
-        if current_time < market_open:
+        # 🔥 정확한 시장 시간 기준 (09:00~15:30) – 개장 전/마감 후
+        if sec < _PHASE_MARKET_OPEN or sec > _PHASE_MARKET_CLOSE:
             return 'closed'
         
         # 시장 시간 내 단계별 구분
-        if current_time <= dt_time(9, 30):
+        if sec <= _PHASE_OPENING_END:
             return 'opening'        # 09:00~09:30 장 초반
-        elif current_time <= dt_time(12, 0):
+        elif sec <= _PHASE_MORNING_END:
             return 'active'         # 09:30~12:00 활성 거래
-        elif current_time <= dt_time(13, 0):
+        elif sec <= _PHASE_LUNCH_END:
             return 'lunch'          # 12:00~13:00 점심시간
-        elif current_time <= dt_time(14, 50):
+        elif sec <= _PHASE_AFTERNOON_END:
             return 'active'         # 13:00~14:50 활성 거래
-        elif current_time <= dt_time(15, 0):
+        elif sec <= _PHASE_PRE_CLOSE_END:
             return 'pre_close'      # 14:50~15:00 마감 전
         else:
             return 'closing'        # 15:00~15:30 마감 시간
     
-    def analyze_buy_conditions(self, stock: Stock, realtime_data: Dict, 
+    def analyze_buy_conditions(self, stock: Stock, realtime_data: RealtimeData, 
                               market_phase: Optional[str] = None) -> bool:
         """매수 조건 분석 (TradingConditionAnalyzer 위임)
         
@@ -115,8 +144,6 @@ class TradingConditionAnalyzer:
                 return False
             
             # BuyConditionAnalyzer에 위임 (Static 메서드 사용)
-            from .buy_condition_analyzer import BuyConditionAnalyzer
-            
             return BuyConditionAnalyzer.analyze_buy_conditions(
                 stock=stock,
                 realtime_data=realtime_data,
@@ -129,7 +156,7 @@ class TradingConditionAnalyzer:
             logger.error(f"매수 조건 분석 오류 {stock.stock_code}: {e}")
             return False
     
-    def analyze_sell_conditions(self, stock: Stock, realtime_data: Dict,
+    def analyze_sell_conditions(self, stock: Stock, realtime_data: RealtimeData,
                                market_phase: Optional[str] = None) -> Optional[str]:
         """매도 조건 분석 (SellConditionAnalyzer 위임)
         
@@ -147,8 +174,6 @@ class TradingConditionAnalyzer:
                 market_phase = self.get_market_phase()
             
             # SellConditionAnalyzer에 위임 (Static 메서드 사용)
-            from .sell_condition_analyzer import SellConditionAnalyzer
-            
             return SellConditionAnalyzer.analyze_sell_conditions(
                 stock=stock,
                 realtime_data=realtime_data,
@@ -162,11 +187,12 @@ class TradingConditionAnalyzer:
             logger.error(f"매도 조건 분석 오류 {stock.stock_code}: {e}")
             return None
     
-    def calculate_buy_quantity(self, stock: Stock) -> int:
+    def calculate_buy_quantity(self, stock: Stock, market_phase: Optional[str] = None) -> int:
         """매수량 계산 (설정 기반 개선 버전)
         
         Args:
             stock: 주식 객체
+            market_phase: 시장 단계 (옵션, None이면 자동 계산)
             
         Returns:
             매수량
@@ -197,7 +223,8 @@ class TradingConditionAnalyzer:
                             base_amount = available_amount
             
             # 시장 단계별 투자 금액 조정 (설정 기반)
-            market_phase = self.get_market_phase()
+            if market_phase is None:
+                market_phase = self.get_market_phase()
             
             if market_phase == 'opening':
                 # 장 초반 비율 적용
@@ -369,49 +396,49 @@ class TradingConditionAnalyzer:
     # ------------------------------------------------------------------
     # 🆕  선행 매수 필터 (호가 잔량·매수비율·체결강도)
     # ------------------------------------------------------------------
-    def _pre_buy_filters(self, stock: Stock, realtime_data: Dict) -> bool:
+    def _pre_buy_filters(self, stock: Stock, realtime_data: RealtimeData) -> bool:
         """호가/체결 정보 기반 1차 매수 필터링"""
         try:
-            cfg = self.performance_config  # 가독성 단축
+            min_ba, max_ab, min_buy_ratio, min_strength, max_pct, min_liq = self._pre_buy_thresholds
+            rt = stock.realtime_data
 
             # 호가 잔량 (default 0)
-            bid_qty = getattr(stock.realtime_data, 'total_bid_qty', 0)
-            ask_qty = getattr(stock.realtime_data, 'total_ask_qty', 0)
+            bid_qty = rt.total_bid_qty
+            ask_qty = rt.total_ask_qty
 
             if bid_qty > 0 and ask_qty > 0:
+                # 매수호가 열세( bid/ask < min_ba )
                 ratio_ba = bid_qty / ask_qty
-                min_ba = cfg.get('min_bid_ask_ratio_for_buy', 1.0)  # 1.2 → 1.0 완화
-                max_ab = cfg.get('max_ask_bid_ratio_for_buy', 3.0)  # 2.5 → 3.0 완화
-
-                # 매수호가 열세( <1.0 )
                 if ratio_ba < min_ba:
-                    logger.debug(f"매수호가 열세({ratio_ba*100:.1f}%)로 매수 제외: {stock.stock_code}")
+                    if is_debug_enabled():
+                        logger.debug(f"매수호가 열세({ratio_ba*100:.1f}%)로 매수 제외: {stock.stock_code}")
                     return False
 
-                # 매도호가 과다( ask/bid > max_ab )
+                # 매도호가 과다( ask/bid >= max_ab )
                 ratio_ab = ask_qty / bid_qty
                 if ratio_ab >= max_ab:
-                    logger.debug(f"매도호가 과다({ratio_ab*100:.1f}%)로 매수 제외: {stock.stock_code}")
+                    if is_debug_enabled():
+                        logger.debug(f"매도호가 과다({ratio_ab*100:.1f}%)로 매수 제외: {stock.stock_code}")
                     return False
 
             # 매수비율 / 체결강도
-            buy_ratio = getattr(stock.realtime_data, 'buy_ratio', 50.0)
-            min_buy_ratio = cfg.get('min_buy_ratio_for_buy', 30.0)  # 40.0 → 30.0 완화
+            buy_ratio = rt.buy_ratio
             if buy_ratio < min_buy_ratio:
-                logger.debug(f"매수비율 낮음({buy_ratio:.1f}%)로 매수 제외: {stock.stock_code}")
+                if is_debug_enabled():
+                    logger.debug(f"매수비율 낮음({buy_ratio:.1f}%)로 매수 제외: {stock.stock_code}")
                 return False
 
-            strength = getattr(stock.realtime_data, 'contract_strength', 100.0)
-            min_strength = cfg.get('min_contract_strength_for_buy', 100.0)  # 110.0 → 100.0 완화
+            strength = rt.contract_strength
             if strength < min_strength:
-                logger.debug(f"체결강도 약함({strength:.1f})로 매수 제외: {stock.stock_code}")
+                if is_debug_enabled():
+                    logger.debug(f"체결강도 약함({strength:.1f})로 매수 제외: {stock.stock_code}")
                 return False
 
             # 일일 등락률 필터 – limit-up 근접 종목 제외
-            price_change_rate = getattr(stock.realtime_data, 'price_change_rate', 0.0)
-            max_pct = cfg.get('max_price_change_rate_for_buy', 20.0)  # 15.0 → 20.0 완화
+            price_change_rate = rt.price_change_rate
             if price_change_rate >= max_pct:
-                logger.debug(f"등락률 높음({price_change_rate:.1f}%)로 매수 제외: {stock.stock_code}")
+                if is_debug_enabled():
+                    logger.debug(f"등락률 높음({price_change_rate:.1f}%)로 매수 제외: {stock.stock_code}")
                 return False
 
             # 🆕 유동성 점수 필터
@@ -420,13 +447,14 @@ class TradingConditionAnalyzer:
             except AttributeError:
                 liq_score = 0.0
 
-            min_liq = cfg.get('min_liquidity_score_for_buy', 2.0)  # 3.0 → 2.0 완화
             if liq_score < min_liq:
-                logger.debug(f"유동성 낮음({liq_score:.1f})로 매수 제외: {stock.stock_code}")
+                if is_debug_enabled():
+                    logger.debug(f"유동성 낮음({liq_score:.1f})로 매수 제외: {stock.stock_code}")
                 return False
 
             return True
 
         except Exception as e:
             logger.error(f"선행 매수 필터 오류 {stock.stock_code}: {e}")
-            return True  # 오류 시 필터 통과시켜 길목 차단 방지 
\ No newline at end of file
+            return True  # 오류 시 필터 통과시켜 길목 차단 방지
+
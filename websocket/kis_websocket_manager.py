@@ -363,6 +363,64 @@ class KISWebSocketManager:
 
         return False
 
+    async def subscribe_stocks(self, stock_codes: List[str], callback: Optional[Callable] = None,
+                               deadline: Optional[float] = None) -> Dict[str, bool]:
+        """여러 종목 구독 (한 코루틴 안에서 순차 전송)
+
+        Args:
+            deadline: time.monotonic() 기준 마감 시각 - 초과 시 남은 종목은 시도하지 않음 (결과에서 제외)
+        """
+        results: Dict[str, bool] = {}
+        for stock_code in stock_codes:
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            results[stock_code] = await self.subscribe_stock(stock_code, callback)
+        return results
+
+    def subscribe_stocks_sync(self, stock_codes: List[str], callback: Optional[Callable] = None,
+                              max_duration: Optional[float] = None) -> Dict[str, bool]:
+        """여러 종목 구독 (동기 방식) - 이벤트 루프 왕복 1회로 일괄 처리
+
+        Args:
+            max_duration: 배치 전체 처리 시간 한도(초) - 초과 시 남은 종목은 시도하지 않음
+
+        Returns:
+            {종목코드: 구독 성공 여부} (시간 한도로 시도하지 못한 종목은 포함되지 않음)
+        """
+        if not stock_codes or not self.connection.is_connected:
+            return {code: False for code in stock_codes}
+
+        deadline = time.monotonic() + max_duration if max_duration is not None else None
+
+        # 이미 구독된 종목은 바로 성공 처리, 나머지만 이벤트 루프로 전달
+        results: Dict[str, bool] = {}
+        to_subscribe: List[str] = []
+        for stock_code in stock_codes:
+            if self.subscription_manager.is_subscribed(stock_code):
+                if callback:
+                    self.subscription_manager.add_stock_callback(stock_code, callback)
+                results[stock_code] = True
+            else:
+                to_subscribe.append(stock_code)
+
+        if not to_subscribe:
+            return results
+
+        if self._event_loop and not self._event_loop.is_closed():
+            try:
+                future = asyncio.run_coroutine_threadsafe(
+                    self.subscribe_stocks(to_subscribe, callback, deadline),
+                    self._event_loop
+                )
+                results.update(future.result(timeout=max(10, 2 * len(to_subscribe))))
+                return results
+            except Exception as e:
+                logger.error(f"동기 일괄 구독 오류 ({len(to_subscribe)}개): {e}")
+
+        for stock_code in to_subscribe:
+            results.setdefault(stock_code, False)
+        return results
+
     def unsubscribe_stock_sync(self, stock_code: str) -> bool:
         """종목 구독 해제 (동기 방식)"""
         # 연결 여부 검사
@@ -522,9 +580,10 @@ class KISWebSocketManager:
             total_messages = self.stats.get('total_messages', 0)
             ping_pong_count = self.stats.get('ping_pong_count', 0)
             
-            # 최근 메시지 수신 시각 (실시간 데이터가 오면 PingPong이 없어도 정상으로 판단)
-            last_msg_time_dt = self.message_handler.stats.get('last_message_time')
-            last_msg_age = (now_kst() - last_msg_time_dt).total_seconds() if last_msg_time_dt else None
+            # 최근 메시지 수신 경과 시간 (실시간 데이터가 오면 PingPong이 없어도 정상으로 판단)
+            # monotonic 차이로 계산 – 상태 요약마다 호출되므로 datetime 생성/차감 생략
+            last_msg_mono = self.message_handler.stats.get('last_message_monotonic')
+            last_msg_age = time.monotonic() - last_msg_mono if last_msg_mono is not None else None
             
             # 건강 상태 판정
             is_healthy = (
@@ -4,6 +4,7 @@ KIS 웹소켓 메시지 처리 전담 클래스
 """
 import asyncio
 import json
+import time
 from typing import Dict, Callable, TYPE_CHECKING, Optional
 from datetime import datetime
 from enum import Enum
@@ -46,6 +47,7 @@ class KISWebSocketMessageHandler:
         self.stats = {
             'messages_received': 0,
             'last_message_time': None,
+            'last_message_monotonic': None,  # 경과 시간 계산용 (time.monotonic)
             'ping_pong_count': 0,
             'last_ping_pong_time': None,
             'errors': 0
@@ -197,6 +199,7 @@ class KISWebSocketMessageHandler:
         try:
             self.stats['messages_received'] += 1
             self.stats['last_message_time'] = now_kst()
+            self.stats['last_message_monotonic'] = time.monotonic()
 
             if message.startswith('{'):
                 # JSON 형태 - 시스템 메시지